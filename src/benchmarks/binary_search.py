@@ -0,0 +1,38 @@
+"""Benchmarks batched binary search against a Python loop of single searches.
+
+Run from the src directory: python -m benchmarks.binary_search [size] [queries]
+"""
+import functools
+import random
+import sys
+from array import array
+from benchmarks.timing import time_batch, time_search
+from main.algorithms.search.binary_search import BinarySearch, np
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    rng = random.Random(0)
+    values = sorted(rng.randrange(2 * size) for _ in range(size))
+    targets = [rng.randrange(2 * size) for _ in range(queries)]
+    sorted_targets = sorted(targets)
+    binary_search = BinarySearch()
+
+    timings = {
+        'loop': time_search(functools.partial(binary_search.binary_search, values), targets),
+        'search_many': time_batch(functools.partial(binary_search.search_many, values), targets),
+        'search_many sorted': time_batch(functools.partial(binary_search.search_many, values), sorted_targets),
+    }
+    if np is not None:
+        buffer = array('q', values)
+        timings['search_many numpy'] = time_batch(functools.partial(binary_search.search_many, buffer), targets)
+
+    baseline = timings['loop']
+    for name, seconds in timings.items():
+        print(f'n={size:<9} m={queries:<8} {name:<20} {seconds:10.4f}s {baseline / seconds:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
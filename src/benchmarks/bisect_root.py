@@ -0,0 +1,52 @@
+"""Benchmarks the root finders of BinarySearch.
+
+The iterations of every method are reported for a few functions, followed by the time of
+solving many square roots one call at a time and, with NumPy, in one vectorized call.
+
+Run from the src directory: python -m benchmarks.bisect_root [roots]
+"""
+import math
+import random
+import sys
+import time
+from main.algorithms.search.binary_search import BinarySearch, np
+
+FUNCTIONS = {
+    'x^2 - 375': (lambda x: x * x - 375, lambda x: 2 * x, 0.0, 375.0),
+    'cos(x) - x': (lambda x: math.cos(x) - x, lambda x: -math.sin(x) - 1, 0.0, 1.0),
+    'e^x - 10^6': (lambda x: math.exp(x) - 1e6, math.exp, 0.0, 100.0),
+}
+METHODS = ('bisection', 'secant', 'newton')
+
+
+def main() -> None:
+    roots = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    binary_search = BinarySearch()
+
+    for name, (f, derivative, low, high) in FUNCTIONS.items():
+        for method in METHODS:
+            start = time.perf_counter()
+            binary_search.bisect_root(f, low, high, 1e-12, method=method, derivative=derivative)
+            seconds = time.perf_counter() - start
+            print(f'{name:<12} {method:<10} iterations={binary_search.last_iterations:<4} {seconds * 1e6:8.1f}us')
+
+    targets = [random.uniform(0, 1000) for _ in range(roots)]
+    start = time.perf_counter()
+    for target in targets:
+        binary_search.bisect_root(lambda x, target=target: x * x - target, 0.0, 1000.0)
+    print(f'm={roots:<9} bisect_root loop  {time.perf_counter() - start:10.4f}s')
+
+    if np is not None:
+        values = np.asarray(targets)
+        start = time.perf_counter()
+        binary_search.bisect_roots(lambda x: x * x - values, np.zeros(roots), np.full(roots, 1000.0))
+        print(f'm={roots:<9} bisect_roots      {time.perf_counter() - start:10.4f}s')
+
+    start = time.perf_counter()
+    for target in targets:
+        binary_search.integer_root(int(target * 10**12))
+    print(f'm={roots:<9} integer_root loop {time.perf_counter() - start:10.4f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Benchmarks the Eytzinger layout index against binary search on a sorted array.
+
+Every size reports the build time and memory of the index, then the time of answering the
+same random queries one at a time and, with NumPy, all at once next to np.searchsorted.
+Sizes of 10^8 need several GB of memory for the keys, the layout, the ranks and the build.
+
+Run from the src directory: python -m benchmarks.eytzinger_index [sizes] [queries]
+"""
+import functools
+import random
+import sys
+from array import array
+from benchmarks.timing import time_batch, time_search
+from main.algorithms.search.binary_search import BinarySearch
+from main.algorithms.search.eytzinger_index import EytzingerIndex, np
+
+
+def main() -> None:
+    sizes = [int(size) for size in sys.argv[1].split(',')] if len(sys.argv) > 1 else [10**6, 10**7]
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    rng = random.Random(0)
+    binary_search = BinarySearch()
+    for size in sizes:
+        values = array('q', range(0, 2 * size, 2))
+        targets = [rng.randrange(2 * size) for _ in range(queries)]
+        index = EytzingerIndex(values)
+        print(f'n={size:<10} build {index.build_seconds:10.4f}s {index.nbytes / 2**20:10.1f}MiB')
+
+        timings = {
+            'binary_search': time_search(functools.partial(binary_search.binary_search, values), targets),
+            'eytzinger search': time_search(index.search, targets),
+        }
+        if np is not None:
+            keys = np.frombuffer(values, dtype=np.int64)
+            timings['np.searchsorted'] = time_batch(functools.partial(np.searchsorted, keys), targets)
+            timings['eytzinger search_many'] = time_batch(index.search_many, targets)
+
+        baseline = timings['binary_search']
+        for name, seconds in timings.items():
+            print(f'n={size:<10} m={queries:<8} {name:<22} {seconds:10.4f}s {baseline / seconds:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Benchmarks the learned index against binary search and np.searchsorted on sorted keys.
+
+For every key distribution and epsilon the number of segments, their size next to the size of
+the keys and the build time are reported, followed by the time of answering the same random
+queries one at a time with BinarySearch.lower_bound, bisect.bisect_left, the learned index
+and, with NumPy, np.searchsorted, and of answering all of them in one np.searchsorted call.
+
+Run from the src directory: python -m benchmarks.learned_index [size] [queries]
+"""
+import bisect
+import functools
+import random
+import sys
+from benchmarks.timing import time_batch, time_search
+from main.algorithms.search.binary_search import BinarySearch, np
+from main.algorithms.search.learned_index import LearnedIndex
+
+DISTRIBUTIONS = {
+    'uniform': lambda rng: rng.randrange(2**62),
+    'lognormal': lambda rng: int(rng.lognormvariate(0, 2) * 10**9),
+    'timestamps': None,
+}
+EPSILONS = (16, 64, 256)
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    rng = random.Random(0)
+    binary_search = BinarySearch()
+    for name, distribution in DISTRIBUTIONS.items():
+        if distribution is None:
+            # Events arriving in bursts, the gaps between them are exponentially distributed
+            values = [0] * size
+            for i in range(1, size):
+                values[i] = values[i - 1] + int(rng.expovariate(1e-3))
+        else:
+            values = sorted(distribution(rng) for _ in range(size))
+        targets = [rng.choice(values) + rng.randrange(-1, 2) for _ in range(queries)]
+
+        timings = {
+            'binary_search': time_search(functools.partial(binary_search.lower_bound, values), targets),
+            'bisect': time_search(functools.partial(bisect.bisect_left, values), targets),
+        }
+        for epsilon in EPSILONS:
+            index = LearnedIndex(values, epsilon)
+            print(
+                f'{name:<11} n={size:<9} epsilon={epsilon:<4} segments={index.segments:<7}'
+                f' {index.nbytes / 2**10:9.1f}KiB of {8 * size / 2**10:.1f}KiB build {index.build_seconds:8.4f}s'
+            )
+            timings[f'learned epsilon={epsilon}'] = time_search(index.lower_bound, targets)
+        if np is not None:
+            keys = np.array(values, dtype=np.int64)
+            timings['np.searchsorted loop'] = time_search(functools.partial(np.searchsorted, keys), targets)
+            timings['np.searchsorted batch'] = time_batch(functools.partial(np.searchsorted, keys), targets)
+
+        baseline = timings['binary_search']
+        for algorithm, seconds in timings.items():
+            print(
+                f'{name:<11} n={size:<9} m={queries:<8} {algorithm:<22} {seconds:10.4f}s {baseline / seconds:8.1f}x'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Benchmarks the memory-mapped index against loading the key file before searching it.
+
+A file of sorted int64 keys is written in chunks, then searched three ways: loaded into a
+list for binary_search, mapped without fences and mapped with one fence per 256KiB. The open
+time, the query time and the growth of the resident memory, read from /proc on Linux, are
+reported for each. The kernel may map a few neighbouring pages on every fault, which raises
+the resident memory of the mapped variants by the same factor.
+
+Run from the src directory: python -m benchmarks.mapped_sorted_index [size] [queries]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from array import array
+from main.algorithms.search.binary_search import BinarySearch
+from main.algorithms.search.mapped_sorted_index import MappedSortedIndex
+
+CHUNK_SIZE = 1 << 20
+# One fence per 64 pages of 4KiB, opening touches 1/64 of the file and a query about 7 pages
+FENCE_STRIDE = 1 << 15
+
+
+def rss() -> int:
+    """Returns the resident memory of the process in KiB on Linux."""
+    with open('/proc/self/statm', encoding='ascii') as file:
+        return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+
+
+def write_keys(path: str, size: int) -> None:
+    """Writes the even numbers below 2 * size, chunk by chunk."""
+    with open(path, 'wb') as file:
+        for start in range(0, size, CHUNK_SIZE):
+            array('q', range(2 * start, 2 * min(start + CHUNK_SIZE, size), 2)).tofile(file)
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    rng = random.Random(0)
+    targets = [rng.randrange(2 * size) for _ in range(queries)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'keys')
+        write_keys(path, size)
+
+        for name, fence_stride in (('mapped', None), ('mapped fences', FENCE_STRIDE)):
+            before = rss()
+            start = time.perf_counter()
+            with MappedSortedIndex(path, fence_stride) as index:
+                opened = time.perf_counter()
+                for target in targets:
+                    index.search(target)
+                searched = time.perf_counter()
+                after = rss()
+            print(
+                f'n={size:<10} {name:<14} open {opened - start:8.4f}s search {searched - opened:8.4f}s'
+                f' rss +{after - before}KiB'
+            )
+
+        before = rss()
+        start = time.perf_counter()
+        with open(path, 'rb') as file:
+            values = array('q', file.read()).tolist()
+        opened = time.perf_counter()
+        binary_search = BinarySearch()
+        for target in targets:
+            binary_search.binary_search(values, target)
+        searched = time.perf_counter()
+        after = rss()
+        print(
+            f'n={size:<10} {"loaded list":<14} open {opened - start:8.4f}s search {searched - opened:8.4f}s'
+            f' rss +{after - before}KiB'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,25 @@
+"""Benchmarks how the parallel merge sort scales with the number of worker processes.
+
+Run from the src directory: python -m benchmarks.parallel_merge_sort [size]
+"""
+import os
+import random
+import sys
+from benchmarks.timing import time_sort
+from main.algorithms.sorting.parallel_merge_sort import ParallelMergeSort
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    array = [random.randint(-2**63, 2**63 - 1) for _ in range(size)]
+    print(f'n={size} cpus={os.cpu_count()}')
+
+    baseline = None
+    for workers in (1, 2, 4, 8, 16):
+        seconds = time_sort(ParallelMergeSort(workers), array)
+        baseline = baseline or seconds
+        print(f'workers={workers:<3} {seconds:10.4f}s {baseline / seconds:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Benchmarks the splitter quality of the parallel sample sort on skewed distributions.
+
+For every distribution the bucket imbalance, the largest bucket over the ideal bucket size,
+is reported with and without oversampling, next to the time of the parallel merge sort.
+
+Run from the src directory: python -m benchmarks.parallel_sample_sort [size] [workers]
+"""
+import os
+import random
+import sys
+from benchmarks.timing import time_sort
+from main.algorithms.sorting.parallel_merge_sort import ParallelMergeSort
+from main.algorithms.sorting.parallel_sample_sort import ParallelSampleSort
+
+DISTRIBUTIONS = {
+    'uniform': lambda rng: rng.randint(-2**63, 2**63 - 1),
+    'exponential': lambda rng: int(rng.expovariate(1e-6)),
+    'pareto': lambda rng: int(rng.paretovariate(1.0)),
+    'normal': lambda rng: int(rng.gauss(0, 1000)),
+    'few_unique': lambda rng: rng.randrange(8),
+}
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    print(f'n={size} workers={workers} cpus={os.cpu_count()}')
+
+    rng = random.Random(0)
+    for name, distribution in DISTRIBUTIONS.items():
+        array = [distribution(rng) for _ in range(size)]
+        print(f'{name:<12} merge sort {time_sort(ParallelMergeSort(workers), array):10.4f}s')
+
+        for oversampling in (1, 32):
+            sorter = ParallelSampleSort(workers, oversampling)
+            seconds = time_sort(sorter, array)
+            imbalance = max(sorter.last_bucket_sizes) / (size / workers)
+            print(
+                f'{name:<12} sample sort {seconds:9.4f}s oversampling={oversampling:<3}'
+                f' buckets={len(sorter.last_bucket_sizes):<3} imbalance={imbalance:6.2f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
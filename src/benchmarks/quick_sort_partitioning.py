@@ -0,0 +1,30 @@
+"""Benchmarks the quick sort partitioning schemes on inputs with few distinct keys.
+
+Run from the src directory: python -m benchmarks.quick_sort_partitioning
+"""
+import random
+import sys
+from benchmarks.timing import time_sort
+from main.algorithms.sorting.quick_sort import QuickSort
+
+
+def main() -> None:
+    # The recursive Lomuto quick sort recurses once per element on duplicate keys
+    sys.setrecursionlimit(100000)
+    sorters = {
+        'lomuto': QuickSort(),
+        'lomuto introsort': QuickSort(introsort=True),
+        'three-way': QuickSort(three_way=True),
+        'three-way introsort': QuickSort(introsort=True, three_way=True),
+    }
+
+    for size in (1000, 5000, 10000):
+        array = [random.randint(0, 3) for _ in range(size)]
+        timings = {name: time_sort(sorter, array) for name, sorter in sorters.items()}
+        baseline = timings['lomuto']
+        for name, seconds in timings.items():
+            print(f'n={size:<6} {name:<20} {seconds:10.4f}s {baseline / seconds:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Benchmarks the search algorithms on sorted arrays with different key and query distributions.
+
+Bisection is the baseline. Exponential search should take fewer probes when the targets are
+near the front of the array, interpolation search when the keys are uniformly distributed.
+In pure Python a probe is cheap next to the arithmetic around it, so the probe counts, which
+decide the time once every probe is a cache or page miss, are reported next to the time.
+
+Run from the src directory: python -m benchmarks.search [size] [queries]
+"""
+import random
+import sys
+import time
+from typing import Callable
+from main.algorithms.search.binary_search import BinarySearch
+from main.algorithms.search.exponential_search import ExponentialSearch
+from main.algorithms.search.interpolation_search import InterpolationSearch
+
+# Every scenario returns the sorted keys and the targets for a size, a query count and a random generator
+SCENARIOS = {
+    'uniform keys': lambda size, queries, rng: (
+        sorted(rng.randrange(2**62) for _ in range(size)),
+        None,
+    ),
+    'front targets': lambda size, queries, rng: (
+        list(range(size)),
+        [int(rng.expovariate(0.01)) % size for _ in range(queries)],
+    ),
+    'skewed keys': lambda size, queries, rng: (
+        sorted(int(rng.lognormvariate(0, 4)) for _ in range(size)),
+        None,
+    ),
+}
+
+
+class _ProbeCounter(list):
+    """List that counts the elements read from it."""
+    probes = 0
+
+    def __getitem__(self, index: int) -> int:
+        self.probes += 1
+        return super().__getitem__(index)
+
+
+def time_search(search: Callable[[list[int], int], int], values: list[int], targets: list[int]) -> tuple[float, float]:
+    """Returns the seconds it takes to search every target and the average number of probes."""
+    start = time.perf_counter()
+    for target in targets:
+        search(values, target)
+    seconds = time.perf_counter() - start
+
+    counter = _ProbeCounter(values)
+    for target in targets:
+        search(counter, target)
+    return seconds, counter.probes / len(targets)
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+
+    rng = random.Random(0)
+    binary_search = BinarySearch()
+    exponential_search = ExponentialSearch()
+    interpolation_search = InterpolationSearch()
+    for name, scenario in SCENARIOS.items():
+        values, targets = scenario(size, queries, rng)
+        if targets is None: targets = [rng.choice(values) for _ in range(queries)]
+
+        timings = {
+            'binary_search': time_search(binary_search.binary_search, values, targets),
+            'exponential_search': time_search(exponential_search.exponential_search, values, targets),
+            'interpolation_search': time_search(interpolation_search.interpolation_search, values, targets),
+        }
+        baseline = timings['binary_search'][0]
+        for algorithm, (seconds, probes) in timings.items():
+            print(
+                f'{name:<14} n={size:<9} {algorithm:<22} {seconds:10.4f}s {baseline / seconds:8.1f}x'
+                f' probes={probes:6.1f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
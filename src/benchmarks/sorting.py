@@ -0,0 +1,203 @@
+"""Benchmarks every sorter over standard input distributions and tracks regressions.
+
+Every run records the wall time, the number of comparisons, swaps and moves, the recursion
+depth and the peak memory of each sorter, for each distribution and size. The results are written as JSON and can be
+compared against a stored baseline, in which case any regression makes the run fail.
+
+Run from the src directory:
+    python -m benchmarks.sorting --sizes 1000,10000 --output results.json
+    python -m benchmarks.sorting --sizes 1000,10000 --baseline benchmarks/baselines/sorting.json
+"""
+import argparse
+import functools
+import json
+import math
+import random
+import sys
+import time
+from typing import Callable, Optional
+from main.algorithms.sorting.adaptive_sort import AdaptiveSort
+from main.algorithms.sorting.bubble_sort import BubbleSort
+from main.algorithms.sorting.bucket_sort import BucketSort
+from main.algorithms.sorting.counting_sort import CountingSort
+from main.algorithms.sorting.heapsort import Heapsort
+from main.algorithms.sorting.insertion_sort import InsertionSort
+from main.algorithms.sorting.instrumentation import SortProfiler
+from main.algorithms.sorting.merge_sort import MergeSort
+from main.algorithms.sorting.quick_sort import QuickSort
+from main.algorithms.sorting.radix_sort import RadixSort
+from main.algorithms.sorting.selection_sort import SelectionSort
+from main.algorithms.sorting.sorter import Sorter
+
+SORTERS = {
+    'bubble_sort': BubbleSort,
+    'insertion_sort': InsertionSort,
+    'selection_sort': SelectionSort,
+    'heapsort': Heapsort,
+    'bottom_up_heapsort': functools.partial(Heapsort, bottom_up=True),
+    'bottom_up_4_ary_heapsort': functools.partial(Heapsort, bottom_up=True, arity=4),
+    'quick_sort': QuickSort,
+    'intro_sort': functools.partial(QuickSort, introsort=True),
+    'three_way_intro_sort': functools.partial(QuickSort, introsort=True, three_way=True),
+    'merge_sort': MergeSort,
+    'natural_merge_sort': functools.partial(MergeSort, natural=True),
+    'bucket_sort': BucketSort,
+    'counting_sort': CountingSort,
+    'radix_sort': RadixSort,
+    'adaptive_sort': AdaptiveSort,
+}
+
+# Quadratic sorters, and the recursive quick sort on presorted inputs, are skipped above this size
+QUADRATIC_SORTERS = {'bubble_sort', 'insertion_sort', 'selection_sort', 'quick_sort'}
+QUADRATIC_MAX_SIZE = 1000
+
+DISTRIBUTIONS = {
+    'sorted': lambda size, rng: list(range(size)),
+    'reversed': lambda size, rng: list(range(size, 0, -1)),
+    'random': lambda size, rng: [rng.randrange(size) for _ in range(size)],
+    'sawtooth': lambda size, rng: [i % max(1, math.isqrt(size)) for i in range(size)],
+    'few_unique': lambda size, rng: [rng.randrange(8) for _ in range(size)],
+    'organ_pipe': lambda size, rng: [min(i, size - i) for i in range(size)],
+}
+
+METRICS = ('seconds', 'comparisons', 'swaps', 'moves', 'max_depth', 'peak_bytes')
+
+# Differences below these are measurement noise rather than regressions
+ABSOLUTE_SLACK = {'seconds': 0.001, 'comparisons': 0, 'swaps': 0, 'moves': 0, 'max_depth': 0, 'peak_bytes': 1024}
+
+
+def measure(factory: Callable[[], Sorter], array: list[int], repeat: int) -> dict[str, Optional[float]]:
+    """Returns the best wall time, the operation counts and the peak memory of sorting the array."""
+    seconds = math.inf
+    for _ in range(repeat):
+        values = list(array)
+        start = time.perf_counter()
+        factory().sort(values)
+        seconds = min(seconds, time.perf_counter() - start)
+        if values != sorted(array): raise AssertionError('Sorter returned an unsorted array.')
+
+    # Memory and operations are profiled in separate runs so the counting does not add to the memory
+    sorter = factory()
+    with SortProfiler(sorter, count_elements=False, trace_calls=False) as profiler:
+        sorter.sort(list(array))
+    peak_bytes = profiler.last.peak_bytes
+
+    sorter = factory()
+    # The profiler leaves the comparisons and moves of sorters that are not comparison based at None
+    with SortProfiler(sorter, trace_memory=False) as profiler:
+        sorter.sort(list(array))
+    stats = profiler.last
+
+    return {
+        'seconds': seconds,
+        'comparisons': stats.comparisons,
+        'swaps': stats.swaps,
+        'moves': stats.moves,
+        'max_depth': stats.max_depth,
+        'peak_bytes': peak_bytes,
+    }
+
+
+def run(sizes: list[int], sorters: list[str], distributions: list[str], repeat: int, seed: int) -> list[dict]:
+    """Benchmarks every combination of sorter, distribution and size."""
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            array = DISTRIBUTIONS[distribution](size, random.Random(seed))
+            for name in sorters:
+                if name in QUADRATIC_SORTERS and size > QUADRATIC_MAX_SIZE: continue
+
+                result = {'algorithm': name, 'distribution': distribution, 'size': size}
+                try:
+                    result.update(measure(SORTERS[name], array, repeat))
+                except RecursionError:
+                    # The recursive quick sort runs out of stack on presorted inputs
+                    result.update(dict.fromkeys(METRICS), error='RecursionError')
+                results.append(result)
+                print(_format(result), file=sys.stderr)
+    return results
+
+
+def compare(results: list[dict], baseline: list[dict], tolerances: dict[str, float]) -> list[str]:
+    """Returns a description of every metric that got worse than the baseline beyond its tolerance."""
+    baseline_results = {(result['algorithm'], result['distribution'], result['size']): result for result in baseline}
+
+    regressions = []
+    for result in results:
+        expected = baseline_results.get((result['algorithm'], result['distribution'], result['size']))
+        if expected is None: continue
+
+        name = f"{result['algorithm']} on {result['distribution']} n={result['size']}"
+        if 'error' in result and 'error' not in expected:
+            regressions.append(f"{name}: now fails with {result['error']}")
+            continue
+
+        for metric in METRICS:
+            # Results recorded before a metric was added do not have it
+            if result.get(metric) is None or expected.get(metric) is None: continue
+            if result[metric] > expected[metric] * (1 + tolerances[metric]) + ABSOLUTE_SLACK[metric]:
+                regressions.append(f'{name}: {metric} {expected[metric]} -> {result[metric]}')
+    return regressions
+
+
+def _format(result: dict) -> str:
+    if 'error' in result:
+        return f"{result['algorithm']:<26} {result['distribution']:<11} n={result['size']:<9} {result['error']}"
+    return (
+        f"{result['algorithm']:<26} {result['distribution']:<11} n={result['size']:<9}"
+        f" {result['seconds']:10.4f}s comparisons={result['comparisons']} swaps={result['swaps']}"
+        f" moves={result['moves']} depth={result['max_depth']}"
+        f" peak={result['peak_bytes']}B"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='1000,10000,100000', help='comma separated sizes, up to 10^7')
+    parser.add_argument('--sorters', default=','.join(SORTERS), help='comma separated sorter names')
+    parser.add_argument('--distributions', default=','.join(DISTRIBUTIONS), help='comma separated distributions')
+    parser.add_argument('--repeat', type=int, default=1, help='number of timed runs, the fastest is kept')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random distributions')
+    parser.add_argument('--output', help='file the JSON results are written to instead of stdout')
+    parser.add_argument('--baseline', help='JSON results to compare against')
+    parser.add_argument('--time-tolerance', type=float, default=0.5, help='allowed relative slowdown')
+    parser.add_argument('--count-tolerance', type=float, default=0.0, help='allowed relative increase in operations')
+    parser.add_argument('--memory-tolerance', type=float, default=0.1, help='allowed relative increase in memory')
+    args = parser.parse_args()
+
+    results = run(
+        [int(size) for size in args.sizes.split(',')],
+        args.sorters.split(','),
+        args.distributions.split(','),
+        args.repeat,
+        args.seed,
+    )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+        tolerances = {
+            'seconds': args.time_tolerance,
+            'comparisons': args.count_tolerance,
+            'swaps': args.count_tolerance,
+            'moves': args.count_tolerance,
+            'max_depth': args.count_tolerance,
+            'peak_bytes': args.memory_tolerance,
+        }
+        regressions = compare(results, baseline, tolerances)
+        if regressions:
+            print(f'\n{len(regressions)} REGRESSIONS against {args.baseline}:', file=sys.stderr)
+            for regression in regressions:
+                print(f'  {regression}', file=sys.stderr)
+            sys.exit(1)
+        print(f'\nNo regressions against {args.baseline}.', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
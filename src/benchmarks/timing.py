@@ -0,0 +1,27 @@
+"""Timing helpers shared by the benchmarks."""
+import time
+from typing import Callable
+from main.algorithms.sorting.sorter import Sorter
+
+
+def time_sort(sorter: Sorter, array: list[int]) -> float:
+    """Returns the seconds it takes the sorter to sort a copy of the array."""
+    array = list(array)
+    start = time.perf_counter()
+    sorter.sort(array)
+    return time.perf_counter() - start
+
+
+def time_search(search: Callable[[int], object], targets: list[int]) -> float:
+    """Returns the seconds it takes to answer the queries one at a time."""
+    start = time.perf_counter()
+    for target in targets:
+        search(target)
+    return time.perf_counter() - start
+
+
+def time_batch(search: Callable[[list[int]], object], targets: list[int]) -> float:
+    """Returns the seconds it takes to answer the queries in a single call."""
+    start = time.perf_counter()
+    search(targets)
+    return time.perf_counter() - start
@@ -1,23 +1,72 @@
-"""Tests whether a number is a prime number - O(sqrt(n))"""
+"""Tests whether a number is a prime number - O(sqrt(n)), O(k * log(n)^3) with Miller-Rabin"""
 import math
+import random
 
 
 class IsPrime:
-    """Class for finding prime numbers."""
+    """Class for finding prime numbers.
+
+    By default trial division is used. In Miller-Rabin mode, numbers with a factor below 100
+    are rejected by division first, the rest are tested against the first 13 prime bases,
+    which never lets a composite pass below 3.3 * 10^24. Larger numbers are tested against
+    rounds random bases on top, each of which lets a composite pass with probability at
+    most 1/4.
+
+    Attributes:
+        _miller_rabin: Whether to use the Miller-Rabin test instead of trial division.
+        _rounds: The number of random bases tried above the deterministic limit.
+        _random: The seeded source of the random bases.
+    """
+    _SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+    _WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    # The smallest strong pseudoprime to all of the witnesses above
+    _DETERMINISTIC_LIMIT = 3317044064679887385961981
+
+    def __init__(self, miller_rabin: bool = False, rounds: int = 20, seed: int = 0) -> None:
+        if rounds < 0: raise ValueError('Rounds should not be negative.')
+        self._miller_rabin = miller_rabin
+        self._rounds = rounds
+        self._random = random.Random(seed)
 
     def is_prime(self, n: int) -> bool:
         """Determines whether a number is a prime number."""
+        if self._miller_rabin: return self._is_prime_miller_rabin(n)
+
         if n < 2: return False
         if n in (2, 3): return True
         if n % 2 == 0 or n % 3 == 0: return False
 
-        limit = int(math.sqrt(n))
-        for i in range(5, limit, 6):
+        limit = math.isqrt(n)
+        for i in range(5, limit + 1, 6):
             if n % i == 0 or n % (i + 2) == 0:
                 return False
 
         return True
 
+    def _is_prime_miller_rabin(self, n: int) -> bool:
+        if n < 2: return False
+        for p in self._SMALL_PRIMES:
+            if n % p == 0: return n == p
+        if n < self._SMALL_PRIMES[-1] ** 2: return True
+
+        # n - 1 = d * 2^s with d odd
+        s = ((n - 1) & (1 - n)).bit_length() - 1
+        d = (n - 1) >> s
+
+        witnesses = list(self._WITNESSES)
+        if n >= self._DETERMINISTIC_LIMIT:
+            witnesses += [self._random.randrange(2, n - 1) for _ in range(self._rounds)]
+        return all(self._is_strong_probable_prime(n, d, s, a) for a in witnesses)
+
+    def _is_strong_probable_prime(self, n: int, d: int, s: int, a: int) -> bool:
+        """Returns whether n passes the strong probable prime test to base a."""
+        x = pow(a, d, n)
+        if x in (1, n - 1): return True
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1: return True
+        return False
+
 
 def main() -> None:
     is_prime = IsPrime()
@@ -25,6 +74,12 @@ def main() -> None:
     print(is_prime.is_prime(31))
     print(is_prime.is_prime(1433))
     print(is_prime.is_prime(31393))
+    print(is_prime.is_prime(49))
+
+    is_prime = IsPrime(miller_rabin=True)
+    print(is_prime.is_prime(2**61 - 1))
+    print(is_prime.is_prime(2**89 - 1))
+    print(is_prime.is_prime(3317044064679887385961981))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,88 @@
+"""An implementation of a segmented sieve of Eratosthenes over odd numbers - O(n * log(log(n)))."""
+import itertools
+import math
+from typing import Iterator
+
+
+class Sieve:
+    """Class that generates the primes of a range with a segmented sieve of Eratosthenes.
+
+    Only odd numbers are stored, one byte each, so a segment of the default 256KiB covers
+    512Ki numbers and stays in a typical L2 cache while every base prime crosses it out. The
+    base primes up to the square root of the end of the range are sieved once up front, and
+    the segments are then sieved and yielded one after the other, which keeps the memory
+    at O(sqrt(hi) + segment) however large the range is.
+
+    Attributes:
+        _segment_size: The number of odd numbers sieved at once.
+    """
+
+    def __init__(self, segment_size: int = 1 << 18) -> None:
+        if segment_size < 1: raise ValueError('Segment size should be at least one.')
+        self._segment_size = segment_size
+
+    def primes(self, hi: int) -> Iterator[int]:
+        """Yields the primes below hi in ascending order."""
+        return self.primes_in_range(2, hi)
+
+    def primes_in_range(self, lo: int, hi: int) -> Iterator[int]:
+        """Yields the primes p with lo <= p < hi in ascending order."""
+        if lo <= 2 < hi: yield 2
+        for low, segment in self._segments(lo, hi):
+            yield from itertools.compress(range(low, low + 2 * len(segment), 2), segment)
+
+    def count_primes(self, lo: int, hi: int) -> int:
+        """Returns the number of primes p with lo <= p < hi without generating them."""
+        count = 1 if lo <= 2 < hi else 0
+        for _, segment in self._segments(lo, hi):
+            count += segment.count(1)
+        return count
+
+    def _segments(self, lo: int, hi: int) -> Iterator[tuple[int, bytearray]]:
+        """Yields the first odd number of every segment of [lo, hi) and its flags, 1 for primes."""
+        # The odd numbers from 3 on, 1 is not a prime
+        low = max(lo, 3) | 1
+        if low >= hi: return
+
+        base_primes = self._small_primes(math.isqrt(hi - 1))
+        while low < hi:
+            size = min(self._segment_size, (hi - low + 1) // 2)
+            segment = bytearray(b'\x01') * size
+            high = low + 2 * size
+            for p in base_primes:
+                square = p * p
+                if square >= high: break
+
+                # The first odd multiple of p in the segment, not below p * p
+                start = max(square, (low + p - 1) // p * p)
+                if start % 2 == 0: start += p
+                index = (start - low) // 2
+                segment[index::p] = bytes(len(range(index, size, p)))
+            yield low, segment
+            low = high
+
+    def _small_primes(self, n: int) -> list[int]:
+        """Returns the odd primes up to n with an unsegmented odd-only sieve."""
+        if n < 3: return []
+
+        # Index i stands for 2 * i + 1
+        size = (n + 1) // 2
+        flags = bytearray(b'\x01') * size
+        flags[0] = 0
+        for i in range(1, (math.isqrt(n) + 1) // 2):
+            if flags[i]:
+                p = 2 * i + 1
+                index = p * p // 2
+                flags[index::p] = bytes(len(range(index, size, p)))
+        return list(itertools.compress(range(1, 2 * size, 2), flags))
+
+
+def main() -> None:
+    sieve = Sieve()
+    print(list(sieve.primes(50)))
+    print(list(sieve.primes_in_range(10**12, 10**12 + 100)))
+    print(sieve.count_primes(0, 10**7))  # 664579
+
+
+if __name__ == '__main__':
+    main()
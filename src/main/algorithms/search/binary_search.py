@@ -1,14 +1,31 @@
 """An implementation of binary search - O(log(n))."""
+import bisect
+import math
+from array import ArrayType
+from typing import Any, Callable, Optional, Sequence, TypeVar, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+T = TypeVar('T')
 
 
 class BinarySearch:
-    """Class that searches an element using binary search."""
+    """Class that searches an element using binary search.
+
+    Attributes:
+        last_iterations: The number of iterations the most recent root search took, kept for profiling.
+    """
     _EPS = 0.00000001
+    _MAX_ITERATIONS = 10000
+
+    def __init__(self) -> None:
+        self.last_iterations = 0
 
     def binary_search(self, array: list[int], target: int) -> int:
         """Returns the index of the target element in the array, otherwise returns -1."""
-        if not array: return
-
         low = 0
         high = len(array) - 1
 
@@ -23,10 +40,130 @@ class BinarySearch:
 
         return -1
 
+    def lower_bound(
+        self,
+        array: Sequence[T],
+        target: Any,
+        *,
+        key: Optional[Callable[[T], Any]] = None,
+        lo: int = 0,
+        hi: Optional[int] = None,
+    ) -> int:
+        """Returns the first index in array[lo:hi] whose key is not less than the target.
+
+        The key is applied to the elements of the array only, never to the target, and the
+        window is searched in place, so slices of large arrays are queried without copying.
+        """
+        low, high = self._window(array, lo, hi)
+        while low < high:
+            mid = (low + high) // 2
+            value = array[mid] if key is None else key(array[mid])
+            if value < target:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def upper_bound(
+        self,
+        array: Sequence[T],
+        target: Any,
+        *,
+        key: Optional[Callable[[T], Any]] = None,
+        lo: int = 0,
+        hi: Optional[int] = None,
+    ) -> int:
+        """Returns the first index in array[lo:hi] whose key is greater than the target."""
+        low, high = self._window(array, lo, hi)
+        while low < high:
+            mid = (low + high) // 2
+            value = array[mid] if key is None else key(array[mid])
+            if target < value:
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
+    def equal_range(
+        self,
+        array: Sequence[T],
+        target: Any,
+        *,
+        key: Optional[Callable[[T], Any]] = None,
+        lo: int = 0,
+        hi: Optional[int] = None,
+    ) -> tuple[int, int]:
+        """Returns the half-open range of indices in array[lo:hi] whose key equals the target."""
+        start = self.lower_bound(array, target, key=key, lo=lo, hi=hi)
+        return start, self.upper_bound(array, target, key=key, lo=start, hi=hi)
+
+    def count_between(
+        self,
+        array: Sequence[T],
+        low: Any,
+        high: Any,
+        *,
+        key: Optional[Callable[[T], Any]] = None,
+        lo: int = 0,
+        hi: Optional[int] = None,
+    ) -> int:
+        """Returns the number of elements in array[lo:hi] whose key lies in [low, high]."""
+        if high < low: return 0
+        start = self.lower_bound(array, low, key=key, lo=lo, hi=hi)
+        return self.upper_bound(array, high, key=key, lo=start, hi=hi) - start
+
+    def _window(self, array: Sequence[Any], lo: int, hi: Optional[int]) -> tuple[int, int]:
+        """Returns the bounds of the searched window, validated against the array."""
+        if hi is None: hi = len(array)
+        if not 0 <= lo <= hi <= len(array): raise ValueError('Window should satisfy 0 <= lo <= hi <= len(array).')
+        return lo, hi
+
+    def search_many(self, array: Sequence[Any], targets: Sequence[Any]) -> list[int]:
+        """Returns the index of the first occurrence of every target in the array, -1 for misses.
+
+        Sorted ndarrays and array.array buffers are searched with np.searchsorted when NumPy is
+        installed, which returns an index ndarray. Otherwise the targets are visited in sorted
+        order and every search gallops forward from the position of the previous target, so a
+        batch of m targets costs O(m * log(n / m)) probes instead of O(m * log(n)).
+        """
+        if np is not None and isinstance(array, (np.ndarray, ArrayType)):
+            return self._search_many_numpy(np.asarray(array), np.asarray(targets))
+
+        size = len(array)
+        indices = [-1] * len(targets)
+        if size == 0: return indices
+
+        order = range(len(targets))
+        if any(targets[i + 1] < targets[i] for i in range(len(targets) - 1)):
+            order = sorted(order, key=targets.__getitem__)
+
+        low = 0
+        for i in order:
+            target = targets[i]
+            low = self._gallop(array, target, low, size)
+            if low < size and array[low] == target: indices[i] = low
+        return indices
+
+    def _gallop(self, array: Sequence[Any], target: Any, low: int, size: int) -> int:
+        """Returns the first index from low on whose element is not less than the target."""
+        step = 1
+        while low + step < size and array[low + step - 1] < target:
+            low += step
+            step *= 2
+        return bisect.bisect_left(array, target, low, min(low + step, size))
+
+    def _search_many_numpy(self, array: 'np.ndarray', targets: 'np.ndarray') -> 'np.ndarray':
+        """Searches all targets at once with np.searchsorted - O(m * log(n))."""
+        indices = np.searchsorted(array, targets)
+        found = indices < array.size
+        found[found] = array[indices[found]] == targets[found]
+        return np.where(found, indices, -1)
+
     def binary_search_sqrt(self, low: float, high: float, target: float) -> float:
         """Returns the square root of the target element."""
         if high <= low: raise ValueError('High should be higher than low.')
 
+        iterations = 0
         while (high - low) > self._EPS:
             mid = (low + high) / 2.0
 
@@ -36,8 +173,146 @@ class BinarySearch:
                 low = mid
             else:
                 high = mid
+            iterations += 1
+
+        self.last_iterations = iterations
+        return (low + high) / 2.0
+
+    def bisect_root(
+        self,
+        f: Callable[[float], float],
+        low: float,
+        high: float,
+        tol: float = _EPS,
+        *,
+        method: str = 'bisection',
+        derivative: Optional[Callable[[float], float]] = None,
+    ) -> float:
+        """Returns a root of f within tol of a sign change of f in [low, high].
+
+        The bisection method halves the bracket every iteration. The secant method interpolates
+        through the last two points and the newton method steps along the derivative, both are
+        safeguarded as in Brent's method: a step that leaves the bracket or is not at most half
+        the previous step is replaced by a bisection, so the bracket keeps shrinking.
+        """
+        if high <= low: raise ValueError('High should be higher than low.')
+        if method not in ('bisection', 'secant', 'newton'): raise ValueError(f'Unknown method {method}.')
+        if method == 'newton' and derivative is None: raise ValueError('The newton method needs a derivative.')
+
+        f_low = f(low)
+        f_high = f(high)
+        iterations = 0
+        if f_low == 0 or f_high == 0:
+            self.last_iterations = iterations
+            return low if f_low == 0 else high
+        if (f_low < 0) == (f_high < 0): raise ValueError('f should change sign between low and high.')
+
+        # The secant runs through the last two points evaluated, newton steps from the last one
+        previous, f_previous = low, f_low
+        x, f_x = high, f_high
+        while high - low > tol and iterations < self._MAX_ITERATIONS:
+            step = None
+            if method == 'secant' and f_x != f_previous:
+                step = x - f_x * (x - previous) / (f_x - f_previous)
+            elif method == 'newton':
+                slope = derivative(x)
+                if slope: step = x - f_x / slope
+            accelerated = step is not None and low < step < high and 2 * abs(step - x) <= abs(x - previous)
+            if not accelerated: step = (low + high) / 2.0
+
+            previous, f_previous = x, f_x
+            x = step
+            f_x = f(x)
+            iterations += 1
+            if f_x == 0: break
+            if (f_x < 0) == (f_low < 0):
+                low, f_low = x, f_x
+            else:
+                high, f_high = x, f_x
+
+            # An accelerated step usually lands just short of the root, a probe half a tol past it
+            # brackets the root within tol instead of creeping towards it from one side
+            if accelerated:
+                probe = x + tol / 2.0 if x == low else x - tol / 2.0
+                if low < probe < high:
+                    f_probe = f(probe)
+                    if (f_probe < 0) == (f_low < 0):
+                        low, f_low = probe, f_probe
+                    else:
+                        high, f_high = probe, f_probe
+
+        self.last_iterations = iterations
+        return x if f_x == 0 else (low + high) / 2.0
+
+    def bisect_roots(
+        self,
+        f: Callable[['np.ndarray'], 'np.ndarray'],
+        lows: Sequence[float],
+        highs: Sequence[float],
+        tol: float = _EPS,
+    ) -> Union[list[float], 'np.ndarray']:
+        """Returns a root of f in every bracket [lows[i], highs[i]], f being applied elementwise.
+
+        With NumPy every bracket is halved at once and f is called with whole arrays, so the
+        iterations cost O(log((high - low) / tol)) array operations for millions of roots.
+        Without NumPy the brackets are solved one at a time with bisect_root. As there, a bracket
+        endpoint where f is zero is returned as the root.
+        """
+        if np is None:
+            return [self.bisect_root(f, low, high, tol) for low, high in zip(lows, highs)]
+
+        lows = np.array(lows, dtype=np.float64)
+        highs = np.array(highs, dtype=np.float64)
+        if np.any(highs <= lows): raise ValueError('High should be higher than low.')
+        f_lows = f(lows)
+        f_highs = f(highs)
+        zero_low = f_lows == 0
+        zero_high = (f_highs == 0) & ~zero_low
+        negative_low = f_lows < 0
+        if np.any((negative_low == (f_highs < 0)) & ~zero_low & ~zero_high):
+            raise ValueError('f should change sign between low and high.')
+
+        # Brackets with a root at an endpoint collapse onto it and are left alone by the bisection
+        highs = np.where(zero_low, lows, highs)
+        lows = np.where(zero_high, highs, lows)
+
+        iterations = 0
+        while iterations < self._MAX_ITERATIONS and np.any(highs - lows > tol):
+            mids = (lows + highs) / 2.0
+            same_sign = (f(mids) < 0) == negative_low
+            lows = np.where(same_sign, mids, lows)
+            highs = np.where(same_sign, highs, mids)
+            iterations += 1
+
+        self.last_iterations = iterations
+        return (lows + highs) / 2.0
+
+    def integer_root(self, n: int, k: int = 2) -> int:
+        """Returns the largest integer whose k-th power is at most n, computed exactly.
+
+        Square roots use math.isqrt. Other roots run Newton's method on integers from an
+        initial guess above the root, which decreases monotonically onto it in O(log(log(n)))
+        iterations, so big integers are handled without any floating point error.
+        """
+        if n < 0: raise ValueError('N should not be negative.')
+        if k < 1: raise ValueError('K should be at least one.')
+        if k == 1 or n < 2:
+            self.last_iterations = 0
+            return n
+        if k == 2:
+            self.last_iterations = 1
+            return math.isqrt(n)
+
+        x = 1 << -(-n.bit_length() // k)
+        iterations = 0
+        while True:
+            y = ((k - 1) * x + n // x ** (k - 1)) // k
+            iterations += 1
+            if y >= x: break
+            x = y
 
-        return mid
+        self.last_iterations = iterations
+        return x
 
 
 def main() -> None:
@@ -45,11 +320,17 @@ def main() -> None:
     array = [-13, 2, 3, 4, 4, 6, 8, 10]
     print(binary_search.binary_search(array, 2))
     print(binary_search.binary_search(array, 40))
+    print(binary_search.search_many(array, [40, 4, -13, 5]))
+    print(binary_search.equal_range(array, 4))
+    print(binary_search.count_between(array, 0, 7))
 
     low = 0.0
     high = 375.0
     target = 375.0
-    print(binary_search.binary_search_sqrt(low, high, target))
+    print(binary_search.binary_search_sqrt(low, high, target), binary_search.last_iterations)
+    root = binary_search.bisect_root(lambda x: x * x - target, low, high, method='secant')
+    print(root, binary_search.last_iterations)
+    print(binary_search.integer_root(10**40 + 1, 3), binary_search.last_iterations)
 
 
 if __name__ == '__main__':
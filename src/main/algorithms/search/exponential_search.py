@@ -0,0 +1,43 @@
+"""An implementation of exponential (galloping) search - O(log(i)) for a match at index i."""
+from typing import Any, Sequence
+from main.algorithms.search.binary_search import BinarySearch
+
+
+class ExponentialSearch:
+    """Class that searches an element by galloping from the front of a sorted array.
+
+    The bound doubles until it passes the target, after which the last doubling is bisected.
+    Both phases take about log(i) probes when the first match is at index i, so targets near
+    the front, such as recent timestamps in a log sorted newest first, are found faster than
+    with a bisection of the whole array.
+    """
+
+    def __init__(self) -> None:
+        self._binary_search = BinarySearch()
+
+    def exponential_search(self, array: Sequence[Any], target: Any) -> int:
+        """Returns the index of the first occurrence of the target in the array, otherwise returns -1."""
+        index = self.lower_bound(array, target)
+        return index if index < len(array) and array[index] == target else -1
+
+    def lower_bound(self, array: Sequence[Any], target: Any) -> int:
+        """Returns the first index whose element is not less than the target."""
+        size = len(array)
+        if size == 0 or not array[0] < target: return 0
+
+        bound = 1
+        while bound < size and array[bound] < target:
+            bound *= 2
+        return self._binary_search.lower_bound(array, target, lo=bound // 2 + 1, hi=min(bound, size))
+
+
+def main() -> None:
+    exponential_search = ExponentialSearch()
+    array = [-13, 2, 3, 4, 4, 6, 8, 10]
+    print(exponential_search.exponential_search(array, 4))
+    print(exponential_search.exponential_search(array, 40))
+    print(exponential_search.exponential_search(array, -13))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+"""An implementation of a static search index in Eytzinger (BFS) layout - O(log(n))."""
+import time
+from array import array as Array
+from typing import Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class EytzingerIndex:
+    """Class that searches a static sorted array of int64 keys stored in Eytzinger layout.
+
+    The keys are permuted into the breadth first order of an implicit binary search tree,
+    node k having its children at 2k and 2k + 1. The first levels of every search then share
+    a few cache lines, and the descent needs no early exit: it always walks to a leaf with
+    k = 2k + (key < target) and recovers the lower bound from the trailing ones of k. The
+    layout and the sorted position of every node are kept in array('q') buffers. When NumPy
+    is installed they are built and searched in batches through zero-copy views.
+
+    Attributes:
+        build_seconds: The wall time it took to build the layout.
+        _size: The number of keys.
+        _layout: The keys in BFS order, slot 0 is unused.
+        _ranks: The position in the sorted array of the key in every slot.
+    """
+
+    def __init__(self, array: Sequence[int]) -> None:
+        start = time.perf_counter()
+        self._size = len(array)
+        if np is not None:
+            array = np.asarray(array, dtype=np.int64)
+            if np.any(array[1:] < array[:-1]): raise ValueError('Array should be sorted.')
+            self._layout, self._ranks = self._build_numpy(array)
+        else:
+            if any(array[i + 1] < array[i] for i in range(self._size - 1)): raise ValueError('Array should be sorted.')
+            self._layout, self._ranks = self._build(array)
+        self.build_seconds = time.perf_counter() - start
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the number of bytes taken by the layout and the ranks."""
+        return (len(self._layout) + len(self._ranks)) * self._layout.itemsize
+
+    def lower_bound(self, target: int) -> int:
+        """Returns the first position in the sorted array whose key is not less than the target."""
+        k = self._descend(target)
+        return int(self._ranks[k]) if k else self._size
+
+    def search(self, target: int) -> int:
+        """Returns the position of the first occurrence of the target in the sorted array, otherwise returns -1."""
+        k = self._descend(target)
+        return int(self._ranks[k]) if k and self._layout[k] == target else -1
+
+    def search_many(self, targets: Sequence[int]) -> Union[list[int], 'np.ndarray']:
+        """Returns the position of the first occurrence of every target, -1 for misses.
+
+        With NumPy all targets descend the tree together, one vectorized step per level, and
+        an index ndarray is returned.
+        """
+        if np is None: return [self.search(target) for target in targets]
+
+        targets = np.asarray(targets, dtype=np.int64)
+        layout = np.frombuffer(self._layout, dtype=np.int64)
+        size = self._size
+        k = np.ones(targets.size, dtype=np.int64)
+        for _ in range(size.bit_length()):
+            inside = k <= size
+            k = np.where(inside, 2 * k + (layout[np.where(inside, k, 0)] < targets), k)
+
+        k //= 2 * ((~k) & (k + 1))
+        found = (k > 0) & (layout[k] == targets)
+        return np.where(found, np.frombuffer(self._ranks, dtype=np.int64)[k], -1)
+
+    def _descend(self, target: int) -> int:
+        """Returns the slot of the first key not less than the target, 0 when there is none."""
+        layout = self._layout
+        size = self._size
+        k = 1
+        while k <= size:
+            k = 2 * k + (layout[k] < target)
+
+        # Undo the right turns taken after the last left turn, whose node is the answer
+        return k >> ((~k) & (k + 1)).bit_length()
+
+    def _build(self, array: Sequence[int]) -> tuple[Array, Array]:
+        """Fills the slots in order with an iterative in-order traversal of the implicit tree - O(n)."""
+        size = len(array)
+        layout = Array('q', bytes(8 * (size + 1)))
+        ranks = Array('q', bytes(8 * (size + 1)))
+
+        i = 0
+        k = 1
+        stack = []
+        while stack or k <= size:
+            if k <= size:
+                stack.append(k)
+                k *= 2
+                continue
+            k = stack.pop()
+            layout[k] = array[i]
+            ranks[k] = i
+            i += 1
+            k = 2 * k + 1
+        return layout, ranks
+
+    def _build_numpy(self, array: 'np.ndarray') -> tuple[Array, Array]:
+        """Computes the sorted position of every slot from its in-order position in a perfect tree."""
+        size = array.size
+        height = size.bit_length()
+        k = np.arange(1, size + 1, dtype=np.int64)
+
+        # Node k at depth d is visited in order after (2 * (k - 2^d) + 1) * 2^(h - 1 - d) - 1 nodes of the perfect tree
+        depth = np.floor(np.log2(k)).astype(np.int64)
+        depth -= (np.int64(1) << depth) > k
+        depth += (np.int64(1) << (depth + 1)) <= k
+        perfect_ranks = (2 * (k - (np.int64(1) << depth)) + 1) << (height - 1 - depth)
+
+        layout = Array('q', bytes(8 * (size + 1)))
+        ranks = Array('q', bytes(8 * (size + 1)))
+        rank_view = np.frombuffer(ranks, dtype=np.int64)
+        rank_view[1 + np.argsort(perfect_ranks)] = np.arange(size, dtype=np.int64)
+        np.frombuffer(layout, dtype=np.int64)[1:] = array[rank_view[1:]]
+        return layout, ranks
+
+
+def main() -> None:
+    index = EytzingerIndex([-13, 2, 3, 4, 4, 6, 8, 10])
+    print(index.search(4), index.search(5), index.lower_bound(5))
+    print(index.search_many([40, 4, -13, 5]))
+    print(f'{index.build_seconds:.6f}s {index.nbytes}B')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""An implementation of interpolation search - O(log(log(n))) on uniform keys, O(log(n)) worst case."""
+import math
+from typing import Sequence, Union
+
+Number = Union[int, float]
+
+
+class InterpolationSearch:
+    """Class that searches a number by interpolating its position between the bounds.
+
+    On uniformly distributed keys, such as hashes, the probe lands close to the target and the
+    range shrinks to about its square root every step. Every probe is followed by a guard
+    probe one square root further, and a probe whose guard does not at least halve the range
+    is a bad one, after which the next probe is the midpoint. Skewed keys therefore never
+    take more than a few times the probes of a bisection.
+    """
+
+    def interpolation_search(self, array: Sequence[Number], target: Number) -> int:
+        """Returns the index of the first occurrence of the target in the array, otherwise returns -1."""
+        index = self.lower_bound(array, target)
+        return index if index < len(array) and array[index] == target else -1
+
+    def lower_bound(self, array: Sequence[Number], target: Number) -> int:
+        """Returns the first index whose element is not less than the target."""
+        low = 0
+        high = len(array)
+        bisect = False
+        while low < high:
+            if bisect:
+                probe = (low + high) // 2
+                if array[probe] < target:
+                    low = probe + 1
+                else:
+                    high = probe
+                bisect = False
+                continue
+
+            low_value = array[low]
+            high_value = array[high - 1]
+            if not low_value < target: return low
+            if high_value < target: return high
+
+            # low_value < target <= high_value, so the keys differ, rounding may overshoot by one
+            size = high - low
+            probe = min(high - 1, low + int((target - low_value) * (size - 1) / (high_value - low_value)))
+
+            # On uniform keys the probe is off by about the square root of the range, a guard that
+            # far behind the probe brackets the target, otherwise the next probe bisects
+            gap = math.isqrt(size) + 1
+            if array[probe] < target:
+                low = probe + 1
+                guard = probe + gap
+                if guard < high:
+                    if array[guard] < target:
+                        low = guard + 1
+                    else:
+                        high = guard
+            else:
+                high = probe
+                guard = probe - gap
+                if guard >= low:
+                    if array[guard] < target:
+                        low = guard + 1
+                    else:
+                        high = guard
+            bisect = 2 * (high - low) > size
+        return low
+
+
+def main() -> None:
+    interpolation_search = InterpolationSearch()
+    array = [-13, 2, 3, 4, 4, 6, 8, 10]
+    print(interpolation_search.interpolation_search(array, 4))
+    print(interpolation_search.interpolation_search(array, 40))
+    print(interpolation_search.interpolation_search([i * i for i in range(1000)], 250000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""An implementation of a learned piecewise linear index over a sorted array - O(log(s) + log(e))."""
+import bisect
+import time
+from array import array as Array
+from typing import Sequence, Union
+
+Number = Union[int, float]
+
+
+class LearnedIndex:
+    """Class that searches a static sorted array by predicting the position of the target.
+
+    The position of the first occurrence of every distinct key is approximated by linear
+    segments, each fitted in a single pass with a shrinking cone: a segment grows while some
+    slope keeps every one of its keys within epsilon positions of its prediction, as in the
+    FITing-Tree and PGM index. A lookup bisects the first keys of the s segments, predicts
+    the position with the segment and bisects the 2 * epsilon positions around it. Targets
+    between two keys can land further away, in which case the window is widened until it
+    brackets the answer.
+
+    Attributes:
+        build_seconds: The wall time it took to fit the segments.
+        _array: The indexed sorted array, which is not copied.
+        _epsilon: The maximum distance of a prediction from the position of a key.
+        _keys: The first key of every segment.
+        _positions: The position of the first key of every segment.
+        _slopes: The positions per key unit of every segment.
+    """
+
+    def __init__(self, array: Sequence[Number], epsilon: int = 64) -> None:
+        if epsilon < 1: raise ValueError('Epsilon should be at least one.')
+        start = time.perf_counter()
+        self._array = array
+        self._epsilon = epsilon
+        self._keys, self._positions, self._slopes = self._fit(array)
+        self.build_seconds = time.perf_counter() - start
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    @property
+    def segments(self) -> int:
+        """Returns the number of linear segments."""
+        return len(self._keys)
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the number of bytes taken by the segments, without the indexed array."""
+        return sum(len(values) * values.itemsize for values in (self._keys, self._positions, self._slopes))
+
+    def lower_bound(self, target: Number) -> int:
+        """Returns the first index whose element is not less than the target."""
+        size = len(self._array)
+        if size == 0 or not self._array[0] < target: return 0
+
+        segment = bisect.bisect_right(self._keys, target) - 1
+        prediction = self._positions[segment] + int(self._slopes[segment] * (target - self._keys[segment]))
+        prediction = min(size, max(0, prediction))
+        lo = max(0, prediction - self._epsilon)
+        hi = min(size, prediction + self._epsilon + 1)
+
+        # Widen the window until the element before it is less than the target and the last one is not
+        gap = self._epsilon
+        while lo > 0 and not self._array[lo - 1] < target:
+            gap *= 2
+            lo = max(0, lo - gap)
+        while hi < size and self._array[hi - 1] < target:
+            gap *= 2
+            hi = min(size, hi + gap)
+        return bisect.bisect_left(self._array, target, lo, hi)
+
+    def search(self, target: Number) -> int:
+        """Returns the index of the first occurrence of the target, otherwise returns -1."""
+        index = self.lower_bound(target)
+        return index if index < len(self._array) and self._array[index] == target else -1
+
+    def _fit(self, array: Sequence[Number]) -> tuple[Array, Array, Array]:
+        """Covers the first occurrences of the distinct keys with error bounded segments - O(n)."""
+        keys = Array('d')
+        positions = Array('q')
+        slopes = Array('d')
+        epsilon = self._epsilon
+
+        first_key = first_position = None
+        low_slope, high_slope = 0.0, float('inf')
+        for i in range(len(array)):
+            key = array[i]
+            if i > 0 and not array[i - 1] < key:
+                if key < array[i - 1]: raise ValueError('Array should be sorted.')
+                continue
+
+            if first_key is not None:
+                dx = key - first_key
+                dy = i - first_position
+                if low_slope * dx <= dy <= high_slope * dx:
+                    # Every slope left in the cone keeps all keys of the segment within epsilon
+                    low_slope = max(low_slope, (dy - epsilon) / dx)
+                    high_slope = min(high_slope, (dy + epsilon) / dx)
+                    continue
+                slopes.append(self._slope(low_slope, high_slope))
+
+            keys.append(key)
+            positions.append(i)
+            first_key, first_position = key, i
+            low_slope, high_slope = 0.0, float('inf')
+
+        if first_key is not None: slopes.append(self._slope(low_slope, high_slope))
+        return keys, positions, slopes
+
+    def _slope(self, low_slope: float, high_slope: float) -> float:
+        """Returns the middle of the cone, or its lower edge when a single key left it open."""
+        return low_slope if high_slope == float('inf') else (low_slope + high_slope) / 2
+
+
+def main() -> None:
+    array = [i * i for i in range(1000)]
+    index = LearnedIndex(array, epsilon=4)
+    print(index.search(250000), index.search(250001), index.lower_bound(250001))
+    print(f'{index.segments} segments {index.nbytes}B {index.build_seconds:.6f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""A sorted int64 key file searched in place through a memory map - O(log(n)) per query."""
+import mmap
+import os
+import tempfile
+from array import array as Array
+from types import TracebackType
+from typing import Callable, Optional, Sequence
+from main.algorithms.search.binary_search import BinarySearch
+
+
+class MappedSortedIndex:
+    """Class that searches a file of sorted native-endian int64 keys without loading it.
+
+    The file is memory-mapped and cast to a zero-copy memoryview, so opening it without
+    fences costs O(1) and the resident memory grows only with the pages the searches touch.
+    The bisection runs directly on the view. With a fence stride, every stride-th key is
+    copied into a small in-memory array when the index is opened, which reads one page per
+    fence, and a query first bisects the fences and then only the stride of keys between two
+    of them, which touches one or two pages instead of one page per probe of a full bisection.
+    The stride should span at least a page, smaller strides would read every page at open.
+
+    Attributes:
+        _mmap: The read-only map of the file, None for an empty file.
+        _keys: The keys as a memoryview of int64 values.
+        _fence_stride: The number of keys between two fences, None without fences.
+        _fences: Every fence_stride-th key.
+        _binary_search: The bisection run on the view and on the fences.
+    """
+    _ITEM_SIZE = 8
+    _MIN_FENCE_STRIDE = mmap.PAGESIZE // _ITEM_SIZE
+
+    def __init__(self, path: str, fence_stride: Optional[int] = None) -> None:
+        if fence_stride is not None and fence_stride < self._MIN_FENCE_STRIDE:
+            raise ValueError(f'Fence stride should be at least {self._MIN_FENCE_STRIDE}, the keys of a page.')
+        size = os.path.getsize(path)
+        if size % self._ITEM_SIZE != 0: raise ValueError('File size should be a multiple of the record size.')
+
+        # The map keeps its own handle of the file, empty files cannot be mapped
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        # Probes are scattered, reading ahead of them only fills the memory with unused pages
+        if self._mmap is not None and hasattr(mmap, 'MADV_RANDOM'): self._mmap.madvise(mmap.MADV_RANDOM)
+        self._keys = memoryview(self._mmap).cast('q') if self._mmap is not None else memoryview(b'').cast('q')
+        self._fence_stride = fence_stride
+        self._fences = Array('q', self._keys[::fence_stride]) if fence_stride is not None else None
+        self._binary_search = BinarySearch()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, index: int) -> int:
+        return self._keys[index]
+
+    def __enter__(self) -> 'MappedSortedIndex':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Releases the view and unmaps the file."""
+        self._keys.release()
+        if self._mmap is not None: self._mmap.close()
+
+    def lower_bound(self, target: int) -> int:
+        """Returns the first index whose key is not less than the target."""
+        lo, hi = self._fence_window(self._binary_search.lower_bound, target)
+        return self._binary_search.lower_bound(self._keys, target, lo=lo, hi=hi)
+
+    def upper_bound(self, target: int) -> int:
+        """Returns the first index whose key is greater than the target."""
+        lo, hi = self._fence_window(self._binary_search.upper_bound, target)
+        return self._binary_search.upper_bound(self._keys, target, lo=lo, hi=hi)
+
+    def equal_range(self, target: int) -> tuple[int, int]:
+        """Returns the half-open range of indices whose key equals the target."""
+        return self.lower_bound(target), self.upper_bound(target)
+
+    def count_between(self, low: int, high: int) -> int:
+        """Returns the number of keys in [low, high]."""
+        if high < low: return 0
+        return self.upper_bound(high) - self.lower_bound(low)
+
+    def search(self, target: int) -> int:
+        """Returns the index of the first occurrence of the target, otherwise returns -1."""
+        index = self.lower_bound(target)
+        return index if index < len(self._keys) and self._keys[index] == target else -1
+
+    def _fence_window(self, bound: Callable[[Sequence[int], int], int], target: int) -> tuple[int, int]:
+        """Returns the window of keys between the two fences around the bound of the target."""
+        size = len(self._keys)
+        if self._fences is None: return 0, size
+
+        # Fence j - 1 lies before the bound and fence j at or after it
+        j = bound(self._fences, target)
+        lo = (j - 1) * self._fence_stride + 1 if j > 0 else 0
+        return lo, min(j * self._fence_stride, size)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'keys')
+        with open(path, 'wb') as file:
+            Array('q', [-13, 2, 3, 4, 4, 6, 8, 10]).tofile(file)
+
+        with MappedSortedIndex(path, fence_stride=512) as index:
+            print(index.search(4), index.search(5))
+            print(index.equal_range(4), index.count_between(0, 7))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""An adaptive sort that samples its input and dispatches to the best suited sorter."""
+import random
+from typing import Any, Callable, NamedTuple, Optional, TypeVar
+from main.algorithms.sorting.bucket_sort import BucketSort
+from main.algorithms.sorting.counting_sort import CountingSort
+from main.algorithms.sorting.insertion_sort import InsertionSort
+from main.algorithms.sorting.merge_sort import MergeSort
+from main.algorithms.sorting.numpy_backend import NumpyBackend
+from main.algorithms.sorting.quick_sort import QuickSort
+from main.algorithms.sorting.radix_sort import RadixSort
+from main.algorithms.sorting.sorter import Sorter
+
+T = TypeVar('T')
+
+
+class SortProfile(NamedTuple):
+    """The properties of the keys the adaptive sort bases its decision on.
+
+    Attributes:
+        size: The number of keys.
+        integers: Whether every key is an integer.
+        key_range: The number of values between the smallest and largest integer key, 0 otherwise.
+        descent_ratio: The sampled share of neighbours out of order, about the number of runs per key.
+        inversion_ratio: The sampled share of pairs out of order, 0 when sorted and 1 when reversed.
+        duplicate_ratio: The sampled share of keys equal to another sampled key.
+    """
+    size: int
+    integers: bool
+    key_range: int
+    descent_ratio: float
+    inversion_ratio: float
+    duplicate_ratio: float
+
+
+class SortDecision(NamedTuple):
+    """The sorter picked by the adaptive sort, with the reason and the profile it was based on."""
+    algorithm: str
+    reason: str
+    profile: SortProfile
+    sorter: Sorter
+
+
+class AdaptiveSort(Sorter):
+    """Class that sorts arrays with the sorter that suits the sampled input best.
+
+    Attributes:
+        last_decision: The decision of the most recent sort, kept for logging.
+        _numpy_backend: Detects integer buffers that are sorted with NumPy.
+        _random: The seeded source of the sample positions.
+    """
+    # Integer inputs are dispatched to the counting and radix sorts
+    comparison_based = False
+    _SMALL_SIZE = 32
+    _SAMPLE_SIZE = 1024
+    # Counting sort is picked for key ranges up to a few times the size, within a fixed cap
+    _COUNTING_RANGE_FACTOR = 2
+    _MAX_COUNTING_RANGE = 1 << 24
+    # Runs of 64 keys on average, or as few inversions, make the natural merge sort close to linear
+    _PRESORTED_RATIO = 1 / 64
+    _DUPLICATE_RATIO = 0.5
+
+    def __init__(self, seed: int = 0) -> None:
+        self.last_decision = None
+        self._numpy_backend = NumpyBackend()
+        self._random = random.Random(seed)
+
+    def sort(self, array: list[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+        values = self._numpy_backend.integer_view(array)
+        if values is not None and key is None and not reverse:
+            if values.size == 0: return
+            self.last_decision = self.decide(values, integers=True)
+            self.last_decision.sorter.sort(array)
+            return
+        super().sort(array, key, reverse)
+
+    def decide(self, keys: list[Any], integers: Optional[bool] = None) -> SortDecision:
+        """Profiles the keys and returns the sorter to use for them."""
+        profile = self.profile(keys, integers)
+        size = profile.size
+
+        if size < self._SMALL_SIZE:
+            return self._decision(InsertionSort(), 'small input', profile)
+
+        if profile.integers and profile.key_range <= min(self._COUNTING_RANGE_FACTOR * size, self._MAX_COUNTING_RANGE):
+            return self._decision(CountingSort(), 'key range is at most a few times the size', profile)
+
+        if self._numpy_backend.integer_view(keys) is not None:
+            return self._decision(BucketSort(), 'wide range integer buffer', profile)
+
+        # Long runs, or keys that are only displaced locally, merge in close to linear time
+        for ratio in (profile.descent_ratio, profile.inversion_ratio):
+            if ratio <= self._PRESORTED_RATIO or ratio >= 1 - self._PRESORTED_RATIO:
+                return self._decision(MergeSort(natural=True), 'nearly sorted or reversed', profile)
+
+        if profile.integers:
+            bits = 8 if size < 1 << 16 else 16
+            passes = -(-(profile.key_range - 1).bit_length() // bits)
+            if 4 * passes <= size.bit_length():
+                return self._decision(RadixSort(bits), f'{passes} radix passes beat log(n) comparisons', profile)
+
+        if profile.duplicate_ratio >= self._DUPLICATE_RATIO:
+            return self._decision(QuickSort(introsort=True, three_way=True), 'many duplicate keys', profile)
+
+        return self._decision(QuickSort(introsort=True), 'no exploitable structure', profile)
+
+    def profile(self, keys: list[Any], integers: Optional[bool] = None) -> SortProfile:
+        """Measures the size and key range and samples the order and duplicates of the keys."""
+        size = len(keys)
+        if integers is None: integers = all(isinstance(key, int) and not isinstance(key, bool) for key in keys)
+        if size < 2: return SortProfile(size, integers, size if integers else 0, 0.0, 0.0, 0.0)
+
+        key_range = 0
+        if integers:
+            # NumPy buffers are scanned with NumPy instead of one element at a time
+            values = self._numpy_backend.integer_view(keys)
+            min_value, max_value = (values.min(), values.max()) if values is not None else (min(keys), max(keys))
+            key_range = int(max_value) - int(min_value) + 1
+
+        sample_size = min(size - 1, self._SAMPLE_SIZE)
+        if sample_size == size - 1:
+            positions = range(size - 1)
+        else:
+            positions = [self._random.randrange(size - 1) for _ in range(sample_size)]
+        descents = sum(1 for i in positions if keys[i + 1] < keys[i])
+
+        inversions = 0
+        for _ in range(sample_size):
+            i, j = self._random.randrange(size), self._random.randrange(size)
+            if i > j: i, j = j, i
+            if keys[j] < keys[i]: inversions += 1
+
+        sample = sorted(keys[i] for i in self._random.sample(range(size), min(size, self._SAMPLE_SIZE)))
+        duplicates = sum(1 for i in range(1, len(sample)) if not sample[i - 1] < sample[i])
+
+        return SortProfile(
+            size,
+            integers,
+            key_range,
+            descents / sample_size,
+            inversions / sample_size,
+            duplicates / len(sample),
+        )
+
+    def _sort(self, array: list[T]) -> None:
+        self.last_decision = self.decide(array)
+        self.last_decision.sorter.sort(array)
+
+    def _argsort(self, keys: list[Any], reverse: bool) -> list[int]:
+        self.last_decision = self.decide(keys)
+        return self.last_decision.sorter.argsort(keys, reverse=reverse)
+
+    def _decision(self, sorter: Sorter, reason: str, profile: SortProfile) -> SortDecision:
+        return SortDecision(type(sorter).__name__, reason, profile, sorter)
+
+
+def main() -> None:
+    sorter = AdaptiveSort()
+    inputs = [
+        [10, 4, 6, 4, 8, -13, 2, 3],
+        [random.randint(0, 1000) for _ in range(1000)],
+        [i / 10 for i in range(100000)] + [random.random() for _ in range(100)],
+        [random.randint(0, 2**40) for _ in range(100000)],
+        [random.random() for _ in range(100000)],
+        [random.choice('abc') for _ in range(100000)],
+    ]
+    for array in inputs:
+        sorter.sort(array)
+        print(sorter.last_decision.algorithm, '-', sorter.last_decision.reason)
+
+
+if __name__ == '__main__':
+    main()
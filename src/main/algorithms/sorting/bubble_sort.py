@@ -1,11 +1,12 @@
 """An implementation of bubble sort - O(n²)."""
+from main.algorithms.sorting.sorter import Sorter
 
 
-class BubbleSort:
+class BubbleSort(Sorter):
     """Class that sorts arrays using bubble sort."""
+    stable = True
 
-    def sort(self, array: list[int]) -> None:
-        if not array: return
+    def _sort(self, array: list[int]) -> None:
         self._bubble_sort(array)
 
     def _bubble_sort(self, array: list[int]) -> None:
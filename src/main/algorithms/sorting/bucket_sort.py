@@ -1,35 +1,101 @@
-"""An implementation of bucket sort - O(n + k)."""
-
-
-class BucketSort:
-    """Class that sorts arrays using bucket sort."""
-
-    def sort(self, array: list[int]) -> None:
-        if not array: return
-
-        min_value = min(array)
-        max_value = max(array)
-        if min_value == max_value: return
-        self._bucket_sort(array, min_value, max_value)
-
-    def _bucket_sort(self, array: list[int], min_value: int, max_value: int) -> None:
-        size = len(array)
-        m = max_value - min_value + 1
-        number_of_buckets = m // size + 1
-        buckets = [[] for _ in range(number_of_buckets)]
-        for i in range(size):
-            bucket_index = (array[i] - min_value) // m
-            buckets[bucket_index].append(array[i])
-
-        j = 0
-        for bucket_index in range(number_of_buckets):
-            bucket = buckets[bucket_index]
-            if bucket is not None:
-                bucket.sort()
-                for k in range(len(bucket)):
-                    array[j] = bucket[k]
+"""An implementation of bucket sort with sampled equal-frequency buckets - O(n * log(n / b))."""
+import bisect
+import random
+from typing import Any, Callable, Optional, TypeVar
+from main.algorithms.sorting.numpy_backend import NumpyBackend
+from main.algorithms.sorting.sorter import Sorter
+
+T = TypeVar('T')
+
+
+class BucketSort(Sorter):
+    """Class that sorts arrays using bucket sort.
+
+    The bucket boundaries are taken from a sorted random sample of the keys, so every bucket
+    receives about the same number of keys however skewed they are, and keys only need to be
+    comparable, which includes floats. Keys equal to a boundary get a bucket of their own that
+    needs no sorting. Small buckets are finished with insertion sort and larger ones are
+    bucketed again, using an explicit stack of slices. Integer ndarrays and array.array buffers
+    are sorted with NumPy when it is installed.
+
+    Attributes:
+        _numpy_backend: The vectorized bucket sort.
+        _random: The seeded source of the sample positions.
+    """
+    stable = True
+    _BUCKET_SIZE = 32
+    _OVERSAMPLING = 4
+
+    def __init__(self, seed: int = 0) -> None:
+        self._numpy_backend = NumpyBackend()
+        self._random = random.Random(seed)
+
+    def sort(self, array: list[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+        values = self._numpy_backend.integer_view(array)
+        if values is not None and key is None and not reverse:
+            self._numpy_backend.bucket_sort(values)
+            return
+        super().sort(array, key, reverse)
+
+    def _sort(self, array: list[T]) -> None:
+        self._bucket_sort(array)
+
+    def _argsort(self, keys: list[Any], reverse: bool) -> list[int]:
+        """Buckets the indices by key, starting from the last index in reverse to stay stable."""
+        order = list(range(len(keys) - 1, -1, -1)) if reverse else list(range(len(keys)))
+        self._bucket_sort(order, keys.__getitem__)
+        if reverse: order.reverse()
+        return order
+
+    def _bucket_sort(self, array: list[T], key: Optional[Callable[[T], Any]] = None) -> None:
+        stack = [(0, len(array))]
+        while stack:
+            start, end = stack.pop()
+            if end - start <= self._BUCKET_SIZE:
+                self._insertion_sort(array, start, end, key)
+                continue
+
+            # Bucket 2i holds the keys between splitters i - 1 and i, bucket 2i + 1 the keys equal to splitter i
+            splitters = self._select_splitters(array, start, end, key)
+            buckets = [[] for _ in range(2 * len(splitters) + 1)]
+            for i in range(start, end):
+                value = array[i] if key is None else key(array[i])
+                bucket_index = bisect.bisect_left(splitters, value)
+                if bucket_index < len(splitters) and not value < splitters[bucket_index]:
+                    buckets[2 * bucket_index + 1].append(array[i])
+                else:
+                    buckets[2 * bucket_index].append(array[i])
+
+            # Every splitter is a sampled key, so each bucket left to sort is smaller than the slice
+            j = start
+            for bucket_index, bucket in enumerate(buckets):
+                if bucket_index % 2 == 0 and len(bucket) > 1: stack.append((j, j + len(bucket)))
+                for item in bucket:
+                    array[j] = item
                     j += 1
 
+    def _select_splitters(self, array: list[T], start: int, end: int, key: Optional[Callable[[T], Any]]) -> list[Any]:
+        """Returns the distinct keys that split a sorted random sample of the slice into equal buckets."""
+        number_of_buckets = max(2, (end - start) // self._BUCKET_SIZE)
+        positions = [self._random.randrange(start, end) for _ in range(number_of_buckets * self._OVERSAMPLING)]
+        sample = sorted(array[i] if key is None else key(array[i]) for i in positions)
+
+        splitters = []
+        for i in range(self._OVERSAMPLING, len(sample), self._OVERSAMPLING):
+            if not splitters or splitters[-1] < sample[i]: splitters.append(sample[i])
+        return splitters
+
+    def _insertion_sort(self, array: list[T], start: int, end: int, key: Optional[Callable[[T], Any]]) -> None:
+        """Sorts a small bucket by shifting larger elements to the right."""
+        for i in range(start + 1, end):
+            item = array[i]
+            value = item if key is None else key(item)
+            j = i
+            while j > start and value < (array[j - 1] if key is None else key(array[j - 1])):
+                array[j] = array[j - 1]
+                j -= 1
+            array[j] = item
+
 
 def main() -> None:
     sorter = BucketSort()
@@ -37,6 +103,11 @@ def main() -> None:
     sorter.sort(array)
     print(array)
 
+    # Latencies are heavily skewed, but the sampled buckets still receive equal shares
+    array = [random.lognormvariate(0, 2) for _ in range(100000)]
+    sorter.sort(array)
+    print(array[:4], array[-4:])
+
 
 if __name__ == '__main__':
     main()
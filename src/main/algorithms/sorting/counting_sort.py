@@ -1,22 +1,65 @@
 """An implementation of counting sort - O(n + k)."""
+from typing import Any, Callable, Optional, TypeVar
+from main.algorithms.sorting.numpy_backend import NumpyBackend
+from main.algorithms.sorting.sorter import Sorter
 
+T = TypeVar('T')
 
-class CountingSort:
-    """Class that sorts arrays using counting sort."""
 
-    def sort(self, array: list[int]) -> None:
-        if not array: return
+class CountingSort(Sorter):
+    """Class that sorts arrays using counting sort.
 
+    Integer ndarrays and array.array buffers are sorted with NumPy when it is installed.
+
+    Attributes:
+        _numpy_backend: The vectorized counting sort.
+    """
+    stable = True
+    comparison_based = False
+
+    def __init__(self) -> None:
+        self._numpy_backend = NumpyBackend()
+
+    def sort(self, array: list[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+        values = self._numpy_backend.integer_view(array)
+        if values is not None and key is None and not reverse:
+            self._numpy_backend.counting_sort(values)
+            return
+        super().sort(array, key, reverse)
+
+    def _sort(self, array: list[int]) -> None:
         min_value = min(array)
         max_value = max(array)
         if min_value == max_value: return
         self._counting_sort(array, min_value, max_value)
 
+    def sort_by_key(self, array: list[T], key: Callable[[T], int], size: int) -> list[T]:
+        """Returns the elements stably ordered by key, where key maps every element into range(size)."""
+        keys = [key(value) for value in array]
+        count = self._count(keys, 0, size)
+
+        # Turn the counts into the first output index of every key
+        total = 0
+        for i in range(size):
+            count[i], total = total, total + count[i]
+
+        output = [None] * len(array)
+        for i in range(len(array)):
+            output[count[keys[i]]] = array[i]
+            count[keys[i]] += 1
+        return output
+
+    def _argsort(self, keys: list[int], reverse: bool) -> list[int]:
+        """Orders the indices with a stable counting pass over the integer keys."""
+        min_value = min(keys)
+        max_value = max(keys)
+        size = max_value - min_value + 1
+        if reverse: return self.sort_by_key(range(len(keys)), lambda i: max_value - keys[i], size)
+        return self.sort_by_key(range(len(keys)), lambda i: keys[i] - min_value, size)
+
     def _counting_sort(self, array: list[int], min_value: int, max_value: int) -> None:
         size = max_value - min_value + 1
-        count = [0 for _ in range(size)]
-        for i in range(len(array)):
-            count[array[i] - min_value] += 1
+        count = self._count(array, min_value, size)
 
         k = 0
         for i in range(size):
@@ -25,6 +68,13 @@ class CountingSort:
                 array[k] = i + min_value
                 k += 1
 
+    def _count(self, keys: list[int], min_value: int, size: int) -> list[int]:
+        """Counts the occurrences of every key in range(min_value, min_value + size)."""
+        count = [0 for _ in range(size)]
+        for i in range(len(keys)):
+            count[keys[i] - min_value] += 1
+        return count
+
 
 def main() -> None:
     sorter = CountingSort()
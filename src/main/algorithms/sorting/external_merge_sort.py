@@ -0,0 +1,159 @@
+"""An implementation of an external merge sort for files of int64 records - O(n * log(n))."""
+import itertools
+import os
+import shutil
+import tempfile
+from array import array as Array
+from contextlib import ExitStack
+from typing import BinaryIO, Iterator, Optional
+from main.algorithms.sorting.k_way_merge import KWayMerge
+from main.algorithms.sorting.quick_sort import QuickSort
+from main.algorithms.sorting.sorter import Sorter
+
+
+class ExternalMergeSort:
+    """Class that sorts files of native-endian int64 records that do not fit in memory.
+
+    The input is cut into runs that fit in the memory budget, every run is sorted with an
+    in-memory sorter and written to a temporary file. The runs are then k-way merged,
+    fan_in at a time, through buffered readers until a single sorted file is left.
+
+    Attributes:
+        _memory_budget: The number of bytes the records held in memory may take up.
+        _fan_in: The maximum number of runs merged at once.
+        _sorter: The in-memory sorter used for the runs.
+        _temp_dir: The directory the temporary runs are written to.
+    """
+    _ITEM_SIZE = 8
+    # A record held in memory takes a list slot, an int object and an array slot
+    _BYTES_PER_RECORD = 64
+
+    def __init__(
+        self,
+        memory_budget: int = 64 * 1024 * 1024,
+        fan_in: int = 16,
+        sorter: Optional[Sorter] = None,
+        temp_dir: Optional[str] = None,
+    ) -> None:
+        if fan_in < 2: raise ValueError('Fan in should be at least two.')
+        if memory_budget < self._BYTES_PER_RECORD * (fan_in + 1):
+            raise ValueError('Memory budget should hold at least one record per merged run.')
+        self._memory_budget = memory_budget
+        self._fan_in = fan_in
+        self._sorter = sorter or QuickSort(introsort=True)
+        self._temp_dir = temp_dir
+
+    def sort_file(self, input_path: str, output_path: str) -> None:
+        """Writes the records of the input file in ascending order to the output file."""
+        if os.path.getsize(input_path) % self._ITEM_SIZE != 0:
+            raise ValueError('File size should be a multiple of the record size.')
+
+        with tempfile.TemporaryDirectory(dir=self._temp_dir) as directory:
+            runs = self._create_runs(input_path, directory)
+            if not runs:
+                with open(output_path, 'wb'):
+                    return
+
+            # Merge passes until the remaining runs can be merged at once
+            merge_pass = 0
+            while len(runs) > self._fan_in:
+                merged_runs = []
+                for i in range(0, len(runs), self._fan_in):
+                    path = os.path.join(directory, f'merge-{merge_pass}-{len(merged_runs)}')
+                    self._merge_runs(runs[i:i + self._fan_in], path)
+                    merged_runs.append(path)
+                runs = merged_runs
+                merge_pass += 1
+
+            if len(runs) == 1:
+                shutil.move(runs[0], output_path)
+            else:
+                self._merge_runs(runs, output_path)
+
+    def _create_runs(self, input_path: str, directory: str) -> list[str]:
+        """Sorts the input chunk by chunk and returns the paths of the sorted runs."""
+        records_per_run = self._memory_budget // self._BYTES_PER_RECORD
+        runs = []
+        with open(input_path, 'rb') as file:
+            while True:
+                path = os.path.join(directory, f'run-{len(runs)}')
+                if not self._write_run(file, records_per_run, path): break
+                runs.append(path)
+        return runs
+
+    def _write_run(self, file: BinaryIO, size: int, path: str) -> bool:
+        """Sorts the next chunk of the file into a run, returns False once the file is exhausted."""
+        # Only one chunk is alive at a time since the values are freed on return
+        values = _RunReader.read_block(file, size).tolist()
+        if not values: return False
+
+        self._sorter.sort(values)
+        with open(path, 'wb') as run:
+            Array('q', values).tofile(run)
+        return True
+
+    def _merge_runs(self, paths: list[str], output_path: str) -> None:
+        """Merges the sorted runs into the output file and deletes them."""
+        # Every reader and the writer get an equal share of the memory budget
+        block_size = max(1, self._memory_budget // (self._BYTES_PER_RECORD * (len(paths) + 1)))
+
+        with ExitStack() as stack:
+            readers = [_RunReader(stack.enter_context(open(path, 'rb')), block_size) for path in paths]
+            output = stack.enter_context(open(output_path, 'wb'))
+
+            # Records are merged lazily and written a block at a time
+            merged = KWayMerge().merge(readers)
+            while True:
+                block = Array('q', itertools.islice(merged, block_size))
+                if not block: break
+                block.tofile(output)
+
+        for path in paths:
+            os.remove(path)
+
+
+class _RunReader:
+    """Class that iterates over the records of a run through a block buffer.
+
+    Attributes:
+        _file: The run file.
+        _block_size: The number of records read from the file at once.
+    """
+
+    def __init__(self, file: BinaryIO, block_size: int) -> None:
+        self._file = file
+        self._block_size = block_size
+
+    def __iter__(self) -> Iterator[int]:
+        while True:
+            block = self.read_block(self._file, self._block_size)
+            if not block: return
+            yield from block
+
+    @staticmethod
+    def read_block(file: BinaryIO, size: int) -> Array:
+        """Reads up to size records from the file."""
+        block = Array('q')
+        try:
+            block.fromfile(file, size)
+        except EOFError:
+            # The records before the end of the file are still read into the block
+            pass
+        return block
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'records')
+        with open(path, 'wb') as file:
+            Array('q', [10, 4, 6, 4, 8, -13, 2, 3]).tofile(file)
+
+        sorter = ExternalMergeSort(memory_budget=64 * 3, fan_in=2)
+        sorter.sort_file(path, path)
+
+        with open(path, 'rb') as file:
+            print(_RunReader.read_block(file, 8).tolist())
+
+
+if __name__ == '__main__':
+    main()
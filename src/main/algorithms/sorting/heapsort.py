@@ -1,47 +1,88 @@
 """An implementation of heapsort - O(n * log(n))."""
+from main.algorithms.sorting.sorter import Sorter
 
 
-class Heapsort:
-    """Class that sorts arrays using heapsort."""
+class Heapsort(Sorter):
+    """Class that sorts arrays using heapsort.
 
-    def sort(self, array: list[int]) -> None:
-        if not array: return
-        self._heapsort(array)
+    Attributes:
+        _bottom_up: Whether to use Floyd's bottom-up sift instead of the classic sink, which moves a hole down
+            to a leaf with one comparison per level and the value back up, about half the comparisons.
+        _arity: The number of children of every node of the heap, arities of 4 or 8 give shallower heaps
+            whose sibling nodes share cache lines.
+    """
+    stable = False
 
-    def _heapsort(self, array: list[int]) -> None:
-        size = len(array)
+    def __init__(self, bottom_up: bool = False, arity: int = 2) -> None:
+        if arity < 2: raise ValueError('Arity should be at least two.')
+        self._bottom_up = bottom_up
+        self._arity = arity
 
-        # Heapify converts array into binary heap - O(n)
-        for i in range(max(0, (size // 2) - 1), -1, -1):
-            self._sink(array, size, i)
+    def _sort(self, array: list[int]) -> None:
+        self._heapsort(array, 0, len(array))
+
+    def sort_range(self, array: list[int], low: int, high: int) -> None:
+        """Sorts the inclusive slice array[low..high] in place."""
+        if low < high: self._heapsort(array, low, high - low + 1)
+
+    def _heapsort(self, array: list[int], offset: int, size: int) -> None:
+        # Heapify converts array into a max heap, starting at the last node with children - O(n)
+        for i in range((size - 2) // self._arity, -1, -1):
+            if self._bottom_up:
+                self._sift_bottom_up(array, offset, size, i, array[offset + i])
+            else:
+                self._sink(array, offset, size, i)
 
         # Sorting
         for i in range(size - 1, 0, -1):
-            self._swap(array, 0, i)
-            self._sink(array, i, 0)
+            if self._bottom_up:
+                # The last leaf is sifted into the hole the maximum leaves at the root
+                value = array[offset + i]
+                array[offset + i] = array[offset]
+                self._sift_bottom_up(array, offset, i, 0, value)
+            else:
+                self._swap(array, offset, offset + i)
+                self._sink(array, offset, i, 0)
 
-    def _sink(self, array: list[int], size: int, i: int) -> None:
-        """Maintains the max-heap property of the entire tree."""
+    def _sink(self, array: list[int], offset: int, size: int, i: int) -> None:
+        """Maintains the max-heap property of the tree rooted at array[offset]."""
         while True:
-            left = 2 * i + 1
-            right = 2 * i + 2
             largest = i
 
-            # Left child is larger than parent
-            if left < size and array[left] > array[largest]:
-                largest = left
-
-            # Right child is larger than parent
-            if right < size and array[right] > array[largest]:
-                largest = right
+            # Move down the tree following the largest of the parent and its children
+            for child in range(self._arity * i + 1, min(self._arity * (i + 1) + 1, size)):
+                if array[offset + child] > array[offset + largest]:
+                    largest = child
 
-            # Move down the tree following the largest node
             if largest != i:
-                self._swap(array, largest, i)
+                self._swap(array, offset + largest, offset + i)
                 i = largest
             else:
                 break
 
+    def _sift_bottom_up(self, array: list[int], offset: int, size: int, i: int, value: int) -> None:
+        """Places the value into the hole at index i of the tree rooted at array[offset]."""
+        start = i
+
+        # Move the hole down to a leaf following the largest child, without comparing the value
+        child = self._arity * i + 1
+        while child < size:
+            largest = child
+            for sibling in range(child + 1, min(child + self._arity, size)):
+                if array[offset + sibling] > array[offset + largest]:
+                    largest = sibling
+            array[offset + i] = array[offset + largest]
+            i = largest
+            child = self._arity * i + 1
+
+        # Move the hole back up until the value fits, usually only a level or two
+        while i > start:
+            parent = (i - 1) // self._arity
+            if not array[offset + parent] < value: break
+            array[offset + i] = array[offset + parent]
+            i = parent
+        array[offset + i] = value
+
     def _swap(self, array: list[int], i: int, j: int) -> None:
         array[i], array[j] = array[j], array[i]
 
@@ -52,6 +93,11 @@ def main() -> None:
     sorter.sort(array)
     print(array)
 
+    sorter = Heapsort(bottom_up=True, arity=4)
+    array = [10, 4, 6, 4, 8, -13, 2, 3]
+    sorter.sort(array)
+    print(array)
+
 
 if __name__ == '__main__':
     main()
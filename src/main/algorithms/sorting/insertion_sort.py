@@ -1,11 +1,12 @@
 """An implementation of insertion sort - O(n²)."""
+from main.algorithms.sorting.sorter import Sorter
 
 
-class InsertionSort:
+class InsertionSort(Sorter):
     """Class that sorts arrays using insertion sort."""
+    stable = True
 
-    def sort(self, array: list[int]) -> None:
-        if not array: return
+    def _sort(self, array: list[int]) -> None:
         self._insertion_sort(array)
 
     def _insertion_sort(self, array: list[int]) -> None:
@@ -0,0 +1,261 @@
+"""Opt-in profiling of sorters that counts operations and times the phases of every sort call.
+
+Nothing is patched outside of a profiler block, so sorters pay no overhead unless profiled.
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+from types import CodeType, FrameType
+from typing import Any, Callable, Optional, TypeVar
+from main.algorithms.sorting.quick_sort import QuickSort
+from main.algorithms.sorting.sorter import Sorter
+
+T = TypeVar('T')
+
+_SORTING_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+class SortStats:
+    """The operations of a single sort call.
+
+    Attributes:
+        comparisons: The number of comparisons between elements or keys, or None when elements are not counted.
+        moves: The number of element writes into the sorted array, or None when elements are not counted.
+        swaps: The number of calls to the _swap methods of the sorters.
+        max_depth: The deepest nesting of a recursive sorter method.
+        peak_bytes: The peak memory allocated while sorting, or None when memory is not traced.
+        seconds: The wall time of the call, including the profiling overhead.
+        phases: The wall time spent in every sorter method, nested calls included.
+    """
+
+    def __init__(self) -> None:
+        self.comparisons = 0
+        self.moves = 0
+        self.swaps = 0
+        self.max_depth = 0
+        self.peak_bytes = None
+        self.seconds = 0.0
+        self.phases = {}
+
+    def __repr__(self) -> str:
+        return (
+            f'SortStats(comparisons={self.comparisons}, moves={self.moves}, swaps={self.swaps},'
+            f' max_depth={self.max_depth}, peak_bytes={self.peak_bytes}, seconds={self.seconds:.6f})'
+        )
+
+
+class SortProfiler:
+    """Context manager that profiles every sort call of a sorter while the block runs.
+
+    Comparisons and moves are counted by sorting wrapped elements in a counting list. Sorters
+    that are not comparison based, such as counting and radix sort, do arithmetic on the
+    elements and are never given wrapped elements, their comparisons and moves are None.
+    Swaps, recursion depth and phases are traced with a profile function over the methods of
+    the sorting modules, including nested sorters, but not over worker processes.
+
+    Attributes:
+        records: The stats of every sort call, in call order.
+        _sorter: The profiled sorter.
+        _callback: Called with the stats after every sort call.
+        _count_elements: Whether to count comparisons and moves, only done for comparison based sorters.
+        _trace_calls: Whether to count swaps and track recursion depth and phases.
+        _trace_memory: Whether to trace the peak memory.
+    """
+
+    def __init__(
+        self,
+        sorter: Sorter,
+        callback: Optional[Callable[[SortStats], None]] = None,
+        count_elements: bool = True,
+        trace_calls: bool = True,
+        trace_memory: bool = True,
+    ) -> None:
+        self.records = []
+        self._sorter = sorter
+        self._callback = callback
+        self._count_elements = count_elements and sorter.comparison_based
+        self._trace_calls = trace_calls
+        self._trace_memory = trace_memory
+
+    def __enter__(self) -> 'SortProfiler':
+        if 'sort' in vars(self._sorter): raise ValueError('Sorter is already being profiled.')
+        sort = self._sorter.sort
+
+        def profiled_sort(array: list[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+            self._profile(sort, array, key, reverse)
+
+        self._sorter.sort = profiled_sort
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        # Removing the instance attribute restores the unprofiled method
+        del self._sorter.sort
+
+    @property
+    def last(self) -> Optional[SortStats]:
+        """Returns the stats of the most recent sort call."""
+        return self.records[-1] if self.records else None
+
+    def _profile(self, sort: Callable, array: list[T], key: Optional[Callable[[T], Any]], reverse: bool) -> None:
+        stats = SortStats()
+        values = array
+        if not self._count_elements:
+            stats.comparisons = stats.moves = None
+        else:
+            values = _CountingList(stats, (_CountingElement(value, stats) for value in array))
+            if key is not None:
+                key = self._counting_key(key, stats)
+
+        tracer = _CallTracer(stats) if self._trace_calls else None
+        tracing_memory = self._trace_memory and tracemalloc.is_tracing()
+        if self._trace_memory:
+            if tracing_memory:
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+        start_bytes = tracemalloc.get_traced_memory()[0] if self._trace_memory else 0
+        previous_profile = sys.getprofile()
+        if tracer is not None: sys.setprofile(tracer.trace)
+
+        start = time.perf_counter()
+        try:
+            sort(values, key, reverse)
+        finally:
+            stats.seconds = time.perf_counter() - start
+            if tracer is not None: sys.setprofile(previous_profile)
+            if self._trace_memory:
+                stats.peak_bytes = tracemalloc.get_traced_memory()[1] - start_bytes
+                if not tracing_memory: tracemalloc.stop()
+
+        if self._count_elements:
+            for i, element in enumerate(values):
+                array[i] = element.value
+
+        self.records.append(stats)
+        if self._callback is not None: self._callback(stats)
+
+    def _counting_key(
+        self, key: Callable[[T], Any], stats: SortStats
+    ) -> Callable[['_CountingElement'], '_CountingElement']:
+        """Returns a key function over wrapped elements whose keys count their comparisons."""
+        return lambda element: _CountingElement(key(element.value), stats)
+
+
+class _CallTracer:
+    """Profile function that counts swaps and tracks the depth and time of sorter methods.
+
+    Attributes:
+        _stats: The stats the calls are recorded in.
+        _active: The number of active frames of every traced method.
+        _stack: The traced frames in call order, with their start times.
+        _traced: Whether the code of every called function belongs to a sorter.
+    """
+
+    def __init__(self, stats: SortStats) -> None:
+        self._stats = stats
+        self._active = {}
+        self._stack = []
+        self._traced = {}
+
+    def trace(self, frame: FrameType, event: str, unused_arg: Any) -> None:
+        code = frame.f_code
+        if event == 'call':
+            if not self._is_traced(code): return
+            if code.co_name == '_swap': self._stats.swaps += 1
+
+            depth = self._active.get(code, 0) + 1
+            self._active[code] = depth
+            self._stats.max_depth = max(self._stats.max_depth, depth)
+            self._stack.append((frame, time.perf_counter()))
+        elif event == 'return' and self._stack and self._stack[-1][0] is frame:
+            _, start = self._stack.pop()
+            self._active[code] -= 1
+
+            # Only the outermost call of a recursive method adds to its phase
+            if self._active[code] == 0:
+                phases = self._stats.phases
+                name = self._phase_name(frame)
+                phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+    def _phase_name(self, frame: FrameType) -> str:
+        """Returns the method name qualified by the class of its instance, or the function name."""
+        code = frame.f_code
+        instance = frame.f_locals.get('self')
+        return code.co_name if instance is None else f'{type(instance).__name__}.{code.co_name}'
+
+    def _is_traced(self, code: CodeType) -> bool:
+        traced = self._traced.get(code)
+        if traced is None:
+            filename = os.path.abspath(code.co_filename)
+            traced = os.path.dirname(filename) == _SORTING_DIRECTORY and filename != os.path.abspath(__file__)
+            self._traced[code] = traced
+        return traced
+
+
+class _CountingElement:
+    """Element that counts the comparisons made between elements.
+
+    Attributes:
+        value: The wrapped value.
+        stats: The stats the comparisons are counted in.
+    """
+    __slots__ = ('value', 'stats')
+
+    def __init__(self, value: Any, stats: SortStats) -> None:
+        self.value = value
+        self.stats = stats
+
+    def __lt__(self, other: '_CountingElement') -> bool:
+        self.stats.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other: '_CountingElement') -> bool:
+        self.stats.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: '_CountingElement') -> bool:
+        self.stats.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other: '_CountingElement') -> bool:
+        self.stats.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other: '_CountingElement') -> bool:
+        self.stats.comparisons += 1
+        return self.value == other.value
+
+    __hash__ = None
+
+
+class _CountingList(list):
+    """List that counts the elements written into it.
+
+    Attributes:
+        stats: The stats the moves are counted in.
+    """
+    __slots__ = ('stats',)
+
+    def __init__(self, stats: SortStats, values: Any) -> None:
+        super().__init__(values)
+        self.stats = stats
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self.stats.moves += len(range(*index.indices(len(self)))) if isinstance(index, slice) else 1
+        super().__setitem__(index, value)
+
+
+def main() -> None:
+    sorter = QuickSort(introsort=True)
+    with SortProfiler(sorter, callback=print) as profiler:
+        sorter.sort([random.randint(0, 1000) for _ in range(10000)])
+        sorter.sort(list(range(10000)))
+
+    for name, seconds in sorted(profiler.last.phases.items(), key=lambda phase: -phase[1]):
+        print(f'{name:<30} {seconds:.4f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""An implementation of a lazy k-way merge of sorted iterables using a loser tree - O(n * log(k))."""
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class KWayMerge:
+    """Class that merges sorted iterables into a single sorted iterator.
+
+    The head of every iterable is kept in a loser tree, a tournament tree whose inner nodes
+    remember the loser of the match played there. Replacing the winner only replays the
+    matches on its path to the root, which takes one comparison per level instead of the two
+    of a binary heap. Items are read on demand, so only the k heads are held in memory, and
+    equal items are yielded in the order of their iterables, which makes the merge stable.
+    """
+
+    def merge(
+        self,
+        iterables: Iterable[Iterable[T]],
+        key: Optional[Callable[[T], Any]] = None,
+        reverse: bool = False,
+    ) -> Iterator[T]:
+        """Yields the items of the iterables, each sorted by key, in sorted order - O(n * log(k))."""
+        iterators = [iter(iterable) for iterable in iterables]
+        size = len(iterators)
+        if size == 0: return
+
+        heads = [None] * size
+        keys = [None] * size
+        exhausted = [False] * size
+
+        def advance(i: int) -> None:
+            """Reads the next item of iterable i, or marks it as exhausted."""
+            for item in iterators[i]:
+                heads[i] = item
+                keys[i] = item if key is None else key(item)
+                return
+            heads[i] = keys[i] = None
+            exhausted[i] = True
+
+        def beats(i: int, j: int) -> bool:
+            """Returns whether the head of iterable i comes before the head of iterable j."""
+            if exhausted[i] or exhausted[j]: return exhausted[j] and (not exhausted[i] or i < j)
+            if reverse:
+                if keys[j] < keys[i]: return True
+                if keys[i] < keys[j]: return False
+            else:
+                if keys[i] < keys[j]: return True
+                if keys[j] < keys[i]: return False
+            return i < j
+
+        for i in range(size):
+            advance(i)
+
+        # The leaf of iterable i is node size + i, inner node n holds the loser of its match
+        tree = [0] * size
+        winners = [0] * size + list(range(size))
+        for node in range(size - 1, 0, -1):
+            left, right = winners[2 * node], winners[2 * node + 1]
+            winners[node], tree[node] = (left, right) if beats(left, right) else (right, left)
+        winner = winners[1] if size > 1 else 0
+        del winners
+
+        while not exhausted[winner]:
+            yield heads[winner]
+            advance(winner)
+
+            # Replay the matches on the path of the winner's leaf to the root
+            node = (size + winner) // 2
+            while node > 0:
+                if beats(tree[node], winner):
+                    tree[node], winner = winner, tree[node]
+                node //= 2
+
+
+def main() -> None:
+    merger = KWayMerge()
+    print(list(merger.merge([[1, 4, 7], [2, 5, 8], [3, 6, 9], []])))
+    print(list(merger.merge([['c', 'a'], ['bb'], ['dddd', 'ddd']], key=len, reverse=True)))
+
+    # Only the heads of the infinite streams are read
+    merged = merger.merge([range(0, 10**18, 2), range(1, 10**18, 2)])
+    print([next(merged) for _ in range(8)])
+
+
+if __name__ == '__main__':
+    main()
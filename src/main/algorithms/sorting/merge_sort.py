@@ -1,12 +1,26 @@
 """An implementation of merge sort - O(n * log(n))."""
+from main.algorithms.sorting.sorter import Sorter
 
 
-class MergeSort:
-    """Class that sorts arrays using merge sort."""
+class MergeSort(Sorter):
+    """Class that sorts arrays using merge sort.
 
-    def sort(self, array: list[int]) -> None:
-        if not array: return
-        self._merge_sort(array)
+    Attributes:
+        _natural: Whether to sort using the natural-run bottom-up merge sort, which merges the runs already
+            present in the input through one auxiliary buffer, so nearly sorted inputs sort in close to O(n).
+    """
+    stable = True
+    _MIN_RUN = 32
+    _MIN_GALLOP = 7
+
+    def __init__(self, natural: bool = False) -> None:
+        self._natural = natural
+
+    def _sort(self, array: list[int]) -> None:
+        if self._natural:
+            self._natural_merge_sort(array)
+        else:
+            self._merge_sort(array)
 
     def _merge_sort(self, array: list[int]) -> None:
         size = len(array)
@@ -42,6 +56,202 @@ class MergeSort:
             j += 1
             k += 1
 
+    def _natural_merge_sort(self, array: list[int]) -> None:
+        """Merges neighbouring runs pass by pass until a single run is left."""
+        size = len(array)
+
+        # Split the array into runs of at least _MIN_RUN elements
+        bounds = []
+        start = 0
+        while start < size:
+            end = self._count_run(array, start, size)
+            if end - start < self._MIN_RUN and end < size:
+                forced_end = min(start + self._MIN_RUN, size)
+                self._insertion_sort(array, start, end, forced_end)
+                end = forced_end
+            bounds.append(start)
+            start = end
+        bounds.append(size)
+
+        buffer = [None] * (size // 2)
+        while len(bounds) > 2:
+            merged_bounds = []
+            for i in range(0, len(bounds) - 1, 2):
+                if i + 2 < len(bounds):
+                    self._merge_runs(array, buffer, bounds[i], bounds[i + 1], bounds[i + 2])
+                merged_bounds.append(bounds[i])
+            merged_bounds.append(size)
+            bounds = merged_bounds
+
+    def _count_run(self, array: list[int], start: int, size: int) -> int:
+        """Returns the end of the run starting at start, reversing it if it is descending."""
+        end = start + 1
+        if end == size: return end
+
+        # Only strictly descending runs are reversed to keep the sort stable
+        if array[end] < array[start]:
+            while end < size and array[end] < array[end - 1]:
+                end += 1
+            i, j = start, end - 1
+            while i < j:
+                array[i], array[j] = array[j], array[i]
+                i += 1
+                j -= 1
+        else:
+            while end < size and not array[end] < array[end - 1]:
+                end += 1
+        return end
+
+    def _insertion_sort(self, array: list[int], low: int, start: int, high: int) -> None:
+        """Extends the sorted slice array[low:start] to array[low:high]."""
+        for i in range(start, high):
+            value = array[i]
+            j = i
+            while j > low and value < array[j - 1]:
+                array[j] = array[j - 1]
+                j -= 1
+            array[j] = value
+
+    def _merge_runs(self, array: list[int], buffer: list[int], low: int, mid: int, high: int) -> None:
+        """Merges the runs array[low:mid] and array[mid:high], copying the shorter one to the buffer."""
+        # Elements already in their final position are left untouched
+        low = self._gallop_right(array[mid], array, low, mid)
+        if low == mid: return
+        high = self._gallop_left(array[mid - 1], array, mid, high)
+
+        if mid - low <= high - mid:
+            self._merge_low(array, buffer, low, mid, high)
+        else:
+            self._merge_high(array, buffer, low, mid, high)
+
+    def _merge_low(self, array: list[int], buffer: list[int], low: int, mid: int, high: int) -> None:
+        """Merges from the front with the left run in the buffer."""
+        left_size = mid - low
+        for i in range(left_size):
+            buffer[i] = array[low + i]
+
+        i, j, k = 0, mid, low
+        left_wins = right_wins = 0
+        while i < left_size and j < high:
+            if array[j] < buffer[i]:
+                array[k] = array[j]
+                j += 1
+                k += 1
+                right_wins += 1
+                left_wins = 0
+
+                # The right run keeps winning, copy everything smaller than buffer[i] at once
+                if right_wins >= self._MIN_GALLOP:
+                    end = self._gallop_left(buffer[i], array, j, high)
+                    while j < end:
+                        array[k] = array[j]
+                        j += 1
+                        k += 1
+                    right_wins = 0
+            else:
+                array[k] = buffer[i]
+                i += 1
+                k += 1
+                left_wins += 1
+                right_wins = 0
+
+                # The left run keeps winning, copy everything not larger than array[j] at once
+                if left_wins >= self._MIN_GALLOP:
+                    end = self._gallop_right(array[j], buffer, i, left_size)
+                    while i < end:
+                        array[k] = buffer[i]
+                        i += 1
+                        k += 1
+                    left_wins = 0
+
+        # The rest of the right run is already in place
+        while i < left_size:
+            array[k] = buffer[i]
+            i += 1
+            k += 1
+
+    def _merge_high(self, array: list[int], buffer: list[int], low: int, mid: int, high: int) -> None:
+        """Merges from the back with the right run in the buffer."""
+        right_size = high - mid
+        for j in range(right_size):
+            buffer[j] = array[mid + j]
+
+        i, j, k = mid - 1, right_size - 1, high - 1
+        left_wins = right_wins = 0
+        while i >= low and j >= 0:
+            if buffer[j] < array[i]:
+                array[k] = array[i]
+                i -= 1
+                k -= 1
+                left_wins += 1
+                right_wins = 0
+
+                # The left run keeps winning, copy everything greater than buffer[j] at once
+                if left_wins >= self._MIN_GALLOP:
+                    start = self._gallop_right(buffer[j], array, low, i + 1)
+                    while i >= start:
+                        array[k] = array[i]
+                        i -= 1
+                        k -= 1
+                    left_wins = 0
+            else:
+                array[k] = buffer[j]
+                j -= 1
+                k -= 1
+                right_wins += 1
+                left_wins = 0
+
+                # The right run keeps winning, copy everything not less than array[i] at once
+                if right_wins >= self._MIN_GALLOP and j >= 0:
+                    start = self._gallop_left(array[i], buffer, 0, j + 1)
+                    while j >= start:
+                        array[k] = buffer[j]
+                        j -= 1
+                        k -= 1
+                    right_wins = 0
+
+        # The rest of the left run is already in place
+        while j >= 0:
+            array[k] = buffer[j]
+            j -= 1
+            k -= 1
+
+    def _gallop_left(self, key: int, array: list[int], start: int, end: int) -> int:
+        """Returns the first index in array[start:end] whose element is not less than key."""
+        low = high = start
+        step = 1
+        while high < end and array[high] < key:
+            low = high + 1
+            high = low + step
+            step *= 2
+        high = min(high, end)
+
+        while low < high:
+            mid = (low + high) // 2
+            if array[mid] < key:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def _gallop_right(self, key: int, array: list[int], start: int, end: int) -> int:
+        """Returns the first index in array[start:end] whose element is greater than key."""
+        low = high = start
+        step = 1
+        while high < end and not key < array[high]:
+            low = high + 1
+            high = low + step
+            step *= 2
+        high = min(high, end)
+
+        while low < high:
+            mid = (low + high) // 2
+            if key < array[mid]:
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
 
 def main() -> None:
     sorter = MergeSort()
@@ -49,6 +259,11 @@ def main() -> None:
     sorter.sort(array)
     print(array)
 
+    sorter = MergeSort(natural=True)
+    array = list(range(100000)) + [50, -1, 7]
+    sorter.sort(array)
+    print(array[:8])
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,78 @@
+"""Vectorized kernels for the sorters that can run on NumPy, used when NumPy is installed."""
+from array import ArrayType
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class NumpyBackend:
+    """Class that sorts integer arrays with NumPy instead of Python loops.
+
+    Only ndarrays and array.array buffers of integers are handled. Those are sorted in place
+    through a zero-copy view, every other input is left to the pure Python implementation.
+    """
+    _INTEGER_TYPECODES = 'bBhHiIlLqQ'
+    _BUCKET_SIZE = 1024
+
+    def integer_view(self, array: Any) -> 'np.ndarray':
+        """Returns a writable one-dimensional view of an integer buffer, otherwise returns None."""
+        if np is None: return
+
+        if isinstance(array, np.ndarray):
+            values = array
+        elif isinstance(array, ArrayType) and array.typecode in self._INTEGER_TYPECODES:
+            if not array: return
+            values = np.frombuffer(array, dtype=array.typecode)
+        else:
+            return
+
+        if values.ndim != 1 or values.dtype.kind not in 'iu' or not values.flags.writeable: return
+        return values
+
+    def counting_sort(self, values: 'np.ndarray') -> None:
+        """Sorts the values with np.bincount and np.repeat - O(n + k)."""
+        if values.size < 2: return
+
+        min_value = values.min()
+        offsets = self._offsets(values, min_value)
+        size = int(offsets.max()) + 1
+        if size == 1: return
+
+        count = np.bincount(offsets.astype(np.intp), minlength=size)
+        keys = (np.arange(size, dtype=np.uint64) + np.uint64(min_value.astype(np.uint64))).astype(values.dtype)
+        values[:] = np.repeat(keys, count)
+
+    def bucket_sort(self, values: 'np.ndarray') -> None:
+        """Sorts the values by partitioning them into equal-width buckets and sorting every bucket."""
+        size = values.size
+        if size < 2: return
+
+        offsets = self._offsets(values, values.min())
+        span = int(offsets.max())
+        if span == 0: return
+
+        # A single bucket could be 2^64 wide, which does not fit the uint64 offsets
+        number_of_buckets = size // self._BUCKET_SIZE
+        if number_of_buckets < 2:
+            values.sort()
+            return
+        width = span // number_of_buckets + 1
+        bucket_indices = (offsets // np.uint64(width)).astype(np.intp)
+        count = np.bincount(bucket_indices, minlength=number_of_buckets)
+        bounds = np.cumsum(count)
+
+        # Partitioning at the bucket boundaries moves every bucket into its slice without argsort
+        kth = bounds[:-1][(bounds[:-1] > 0) & (bounds[:-1] < size)]
+        if kth.size: values.partition(np.unique(kth))
+        if width == 1: return
+
+        for bucket_index in np.flatnonzero(count > 1):
+            end = bounds[bucket_index]
+            values[end - count[bucket_index]:end].sort()
+
+    def _offsets(self, values: 'np.ndarray', min_value: Any) -> 'np.ndarray':
+        """Returns values - min_value without overflowing the dtype of the values."""
+        return values.astype(np.uint64) - min_value.astype(np.uint64)
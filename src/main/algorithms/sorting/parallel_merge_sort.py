@@ -0,0 +1,96 @@
+"""An implementation of a parallel merge sort over shared memory - O(n * log(n) / p + n * log(p))."""
+import os
+from array import array as Array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+from main.algorithms.sorting.k_way_merge import KWayMerge
+from main.algorithms.sorting.merge_sort import MergeSort
+from main.algorithms.sorting.sorter import Sorter
+
+
+class ParallelMergeSort(Sorter):
+    """Class that sorts arrays of int64 values using a pool of worker processes.
+
+    The values are copied once into a shared memory buffer. Every worker attaches to the
+    buffer by name and sorts its own chunk in place, so the data is never pickled. The
+    sorted chunks are then k-way merged in the calling process. Sorting by key or in reverse
+    is done by the chunk sorter in the calling process.
+
+    Attributes:
+        stable: Whether the chunk sorter is stable, chunks are merged in order.
+        comparison_based: Whether the sort stays in this process with a comparison based chunk sorter.
+        _workers: The number of worker processes.
+        _sorter: The sorter every worker uses for its chunk.
+    """
+    _ITEM_SIZE = 8
+
+    def __init__(self, workers: Optional[int] = None, sorter: Optional[Sorter] = None) -> None:
+        self._workers = workers if workers is not None else os.cpu_count() or 1
+        if self._workers < 1: raise ValueError('There should be at least one worker.')
+        self._sorter = sorter or MergeSort(natural=True)
+        self.stable = self._sorter.stable
+        self.comparison_based = self._workers == 1 and self._sorter.comparison_based
+
+    def _sort(self, array: list[int]) -> None:
+        if self._workers == 1:
+            self._sorter.sort(array)
+            return
+        self._parallel_merge_sort(array)
+
+    def _argsort(self, keys: list[int], reverse: bool) -> list[int]:
+        return self._sorter.argsort(keys, reverse=reverse)
+
+    def _parallel_merge_sort(self, array: list[int]) -> None:
+        size = len(array)
+        chunk_size = -(-size // self._workers)
+        bounds = [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+        shared_memory = SharedMemory(create=True, size=size * self._ITEM_SIZE)
+        try:
+            view = shared_memory.buf.cast('q')
+            try:
+                view[:] = Array('q', array)
+                with ProcessPoolExecutor(max_workers=len(bounds)) as executor:
+                    futures = [
+                        executor.submit(self._sort_chunk, shared_memory.name, start, end)
+                        for start, end in bounds
+                    ]
+                    for future in futures:
+                        future.result()
+                self._merge_chunks(array, view, bounds)
+            finally:
+                view.release()
+        finally:
+            shared_memory.close()
+            shared_memory.unlink()
+
+    def _sort_chunk(self, name: str, start: int, end: int) -> None:
+        """Sorts view[start:end] of the shared memory buffer inside a worker process."""
+        shared_memory = SharedMemory(name=name)
+        try:
+            view = shared_memory.buf.cast('q')
+            try:
+                chunk = view[start:end].tolist()
+                self._sorter.sort(chunk)
+                view[start:end] = Array('q', chunk)
+            finally:
+                view.release()
+        finally:
+            shared_memory.close()
+
+    def _merge_chunks(self, array: list[int], view: memoryview, bounds: list[tuple[int, int]]) -> None:
+        """Merges the sorted chunks into the array using a loser tree of the chunk heads."""
+        for k, value in enumerate(KWayMerge().merge(view[start:end] for start, end in bounds)):
+            array[k] = value
+
+
+def main() -> None:
+    sorter = ParallelMergeSort(workers=4)
+    array = [10, 4, 6, 4, 8, -13, 2, 3]
+    sorter.sort(array)
+    print(array)
+
+
+if __name__ == '__main__':
+    main()
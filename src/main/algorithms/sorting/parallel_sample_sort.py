@@ -0,0 +1,170 @@
+"""An implementation of a parallel sample sort over shared memory - O(n * log(n) / p)."""
+import bisect
+import itertools
+import os
+import random
+from array import array as Array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+from main.algorithms.sorting.merge_sort import MergeSort
+from main.algorithms.sorting.sorter import Sorter
+
+
+class ParallelSampleSort(Sorter):
+    """Class that sorts arrays of int64 values using a pool of worker processes.
+
+    A sorted random sample of the values picks the splitters between one bucket per worker.
+    Taking oversampling values per bucket evens out the buckets on skewed inputs. Every worker
+    then groups its chunk of a shared memory buffer by bucket in place, after which every
+    worker gathers one bucket from all chunks, sorts it and writes it to its final position in
+    a second shared buffer. Unlike the parallel merge sort there is no serial merge at the end.
+
+    Attributes:
+        stable: Whether the bucket sorter is stable, buckets are gathered in order.
+        comparison_based: Whether the sort stays in this process with a comparison based bucket sorter.
+        last_bucket_sizes: The bucket sizes of the most recent sort, a measure of the splitters.
+        _workers: The number of worker processes.
+        _oversampling: The number of sampled values per bucket.
+        _sorter: The sorter every worker uses for its bucket.
+        _random: The seeded source of the sample positions.
+    """
+    _ITEM_SIZE = 8
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        oversampling: int = 32,
+        sorter: Optional[Sorter] = None,
+        seed: int = 0,
+    ) -> None:
+        self._workers = workers if workers is not None else os.cpu_count() or 1
+        if self._workers < 1: raise ValueError('There should be at least one worker.')
+        if oversampling < 1: raise ValueError('Oversampling should be at least one.')
+        self._oversampling = oversampling
+        self._sorter = sorter or MergeSort(natural=True)
+        self._random = random.Random(seed)
+        self.stable = self._sorter.stable
+        self.comparison_based = self._workers == 1 and self._sorter.comparison_based
+        self.last_bucket_sizes = None
+
+    def _sort(self, array: list[int]) -> None:
+        if self._workers == 1:
+            self._sorter.sort(array)
+            self.last_bucket_sizes = [len(array)]
+            return
+        self._parallel_sample_sort(array)
+
+    def _argsort(self, keys: list[int], reverse: bool) -> list[int]:
+        return self._sorter.argsort(keys, reverse=reverse)
+
+    def _parallel_sample_sort(self, array: list[int]) -> None:
+        size = len(array)
+        splitters = self._select_splitters(array)
+        chunk_size = -(-size // self._workers)
+        bounds = [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+        with ExitStack() as stack:
+            source = self._create_shared_memory(stack, size)
+            target = self._create_shared_memory(stack, size)
+            view = self._view(stack, source)
+            view[:] = Array('q', array)
+
+            with ProcessPoolExecutor(max_workers=self._workers) as executor:
+                futures = [
+                    executor.submit(self._partition_chunk, source.name, start, end, splitters)
+                    for start, end in bounds
+                ]
+                counts = [future.result() for future in futures]
+
+                # Bucket b of chunk w starts after the smaller buckets of the chunk, and ends up
+                # after every smaller bucket of all chunks and bucket b of the chunks before w
+                bucket_sizes = [sum(chunk_counts[b] for chunk_counts in counts) for b in range(len(splitters) + 1)]
+                futures = []
+                target_start = 0
+                for b, bucket_size in enumerate(bucket_sizes):
+                    pieces = []
+                    for (start, _), chunk_counts in zip(bounds, counts):
+                        piece_start = start + sum(chunk_counts[:b])
+                        pieces.append((piece_start, piece_start + chunk_counts[b]))
+                    futures.append(executor.submit(self._sort_bucket, source.name, target.name, pieces, target_start))
+                    target_start += bucket_size
+                for future in futures:
+                    future.result()
+
+            values = self._view(stack, target).tolist()
+            for i in range(size):
+                array[i] = values[i]
+        self.last_bucket_sizes = bucket_sizes
+
+    def _select_splitters(self, array: list[int]) -> list[int]:
+        """Returns the distinct values that split a sorted random sample into equal buckets."""
+        sample_size = self._workers * self._oversampling
+        sample = sorted(array[self._random.randrange(len(array))] for _ in range(sample_size))
+
+        # Equal splitters would leave empty buckets, the duplicates all go into a single bucket
+        return sorted(set(sample[i * self._oversampling] for i in range(1, self._workers)))
+
+    def _partition_chunk(self, name: str, start: int, end: int, splitters: list[int]) -> list[int]:
+        """Groups view[start:end] by bucket inside a worker process and returns the bucket sizes."""
+        with ExitStack() as stack:
+            view = self._attach(stack, name)
+            buckets = [[] for _ in range(len(splitters) + 1)]
+            for value in view[start:end].tolist():
+                buckets[bisect.bisect_right(splitters, value)].append(value)
+            view[start:end] = Array('q', itertools.chain.from_iterable(buckets))
+            return [len(bucket) for bucket in buckets]
+
+    def _sort_bucket(
+        self,
+        source_name: str,
+        target_name: str,
+        pieces: list[tuple[int, int]],
+        target_start: int,
+    ) -> None:
+        """Gathers the pieces of a bucket from every chunk inside a worker process, sorts them
+        and writes them to their final position in the target buffer."""
+        with ExitStack() as stack:
+            source = self._attach(stack, source_name)
+            bucket = []
+            for start, end in pieces:
+                bucket.extend(source[start:end].tolist())
+            self._sorter.sort(bucket)
+
+            target = self._attach(stack, target_name)
+            target[target_start:target_start + len(bucket)] = Array('q', bucket)
+
+    def _create_shared_memory(self, stack: ExitStack, size: int) -> SharedMemory:
+        """Creates a shared memory buffer for size values that is freed when the stack closes."""
+        shared_memory = SharedMemory(create=True, size=max(1, size * self._ITEM_SIZE))
+        stack.callback(shared_memory.unlink)
+        stack.callback(shared_memory.close)
+        return shared_memory
+
+    def _attach(self, stack: ExitStack, name: str) -> memoryview:
+        """Attaches to the shared memory buffer by name inside a worker process."""
+        shared_memory = SharedMemory(name=name)
+        stack.callback(shared_memory.close)
+        return self._view(stack, shared_memory)
+
+    def _view(self, stack: ExitStack, shared_memory: SharedMemory) -> memoryview:
+        """Returns an int64 view of the shared memory buffer that is released when the stack closes."""
+        view = shared_memory.buf.cast('q')
+        stack.callback(view.release)
+        return view
+
+
+def main() -> None:
+    sorter = ParallelSampleSort(workers=4)
+    array = [10, 4, 6, 4, 8, -13, 2, 3]
+    sorter.sort(array)
+    print(array)
+
+    array = [int(random.expovariate(1e-6)) for _ in range(100000)]
+    sorter.sort(array)
+    print(sorter.last_bucket_sizes)
+
+
+if __name__ == '__main__':
+    main()
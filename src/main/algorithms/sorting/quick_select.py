@@ -0,0 +1,104 @@
+"""An implementation of introselect, partial sorting and streaming top k - O(n)."""
+from typing import Any, Callable, Iterable, Optional, TypeVar
+from main.algorithms.sorting.quick_sort import QuickSort
+from main.data_structures.priority_queue.binary_heap import BinaryHeap
+
+T = TypeVar('T')
+
+
+class QuickSelect(QuickSort):
+    """Class that selects the k-th smallest elements without sorting the whole array.
+
+    Selection partitions like the three-way quick sort but only continues into the side that
+    holds the wanted index. Once the pivots keep being bad, the pivot is picked with the median
+    of medians instead, which bounds the worst case to O(n).
+    """
+
+    def __init__(self) -> None:
+        super().__init__(introsort=True, three_way=True)
+
+    def nth_element(self, array: list[T], n: int) -> T:
+        """Moves the element that belongs at index n when sorted to index n, with no larger element
+        before it and no smaller element after it, and returns it - O(n)."""
+        if not 0 <= n < len(array): raise IndexError('Index should be within the array.')
+        self._select(array, 0, len(array) - 1, n)
+        return array[n]
+
+    def partial_sort(self, array: list[T], k: int) -> None:
+        """Moves the k smallest elements to the front of the array in sorted order - O(n + k * log(k))."""
+        if not 0 <= k <= len(array): raise ValueError('k should be between 0 and the size of the array.')
+        if k == 0: return
+        self._select(array, 0, len(array) - 1, k - 1)
+        self._heapsort.sort_range(array, 0, k - 1)
+
+    def top_k(self, iterable: Iterable[T], k: int, key: Optional[Callable[[T], Any]] = None) -> list[T]:
+        """Returns the k largest items of the stream, largest first, using O(k) memory - O(n * log(k))."""
+        if k < 0: raise ValueError('k should not be negative.')
+        if k == 0: return []
+
+        # Min heap of the k largest items seen so far, earlier items win ties
+        heap = BinaryHeap()
+        for index, item in enumerate(iterable):
+            entry = (item if key is None else key(item), -index, item)
+            if heap.size() < k:
+                heap.add(entry)
+            elif heap.peek()[:2] < entry[:2]:
+                heap.poll()
+                heap.add(entry)
+
+        entries = []
+        while not heap.is_empty():
+            entries.append(heap.poll())
+        entries.reverse()
+        return [item for _, _, item in entries]
+
+    def _select(self, array: list[T], low: int, high: int, n: int) -> None:
+        """Partitions array[low..high] until index n holds its sorted element."""
+        depth = 2 * (high - low + 1).bit_length()
+        while high - low >= self._INSERTION_SORT_THRESHOLD:
+            if depth == 0:
+                pivot_index = self._median_of_medians(array, low, high)
+            else:
+                depth -= 1
+                pivot_index = self._select_pivot(array, low, high)
+
+            self._swap(array, pivot_index, high)
+            lt, gt = self._split(array, low, high)
+            if n < lt:
+                high = lt - 1
+            elif n > gt:
+                low = gt + 1
+            else:
+                return
+        self._insertion_sort(array, low, high)
+
+    def _median_of_medians(self, array: list[T], low: int, high: int) -> int:
+        """Returns the index of the median of the medians of groups of five elements."""
+        groups = 0
+        for start in range(low, high + 1, 5):
+            end = min(start + 4, high)
+            self._insertion_sort(array, start, end)
+
+            # Collect the medians at the front of the slice
+            self._swap(array, low + groups, (start + end) // 2)
+            groups += 1
+
+        mid = low + (groups - 1) // 2
+        self._select(array, low, low + groups - 1, mid)
+        return mid
+
+
+def main() -> None:
+    select = QuickSelect()
+    array = [10, 4, 6, 4, 8, -13, 2, 3]
+    print(select.nth_element(array, 3))
+
+    select.partial_sort(array, 3)
+    print(array[:3])
+
+    print(select.top_k(iter(range(1000000)), 5))
+    print(select.top_k(['aa', 'b', 'cccc', 'ddd'], 2, key=len))
+
+
+if __name__ == '__main__':
+    main()
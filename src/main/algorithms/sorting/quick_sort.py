@@ -1,20 +1,104 @@
 """An implementation of quick sort - O(n * log(n))."""
+from main.algorithms.sorting.heapsort import Heapsort
+from main.algorithms.sorting.sorter import Sorter
 
 
-class QuickSort:
-    """Class that sorts arrays using quick sort."""
+class QuickSort(Sorter):
+    """Class that sorts arrays using quick sort.
 
-    def sort(self, array: list[int]) -> None:
-        if not array: return
-        self._quick_sort(array, 0, len(array) - 1)
+    Attributes:
+        _introsort: Whether to sort using introsort instead of the recursive quick sort, which falls back to
+            heapsort once the partitioning gets too deep and bounds the worst case to O(n * log(n)).
+        _three_way: Whether to use Bentley-McIlroy three-way partitioning instead of Lomuto, which groups all
+            keys equal to the pivot in one pass, so inputs with few distinct keys sort in close to linear time.
+        _heapsort: The heapsort used when introsort exceeds its depth budget.
+    """
+    stable = False
+    _INSERTION_SORT_THRESHOLD = 16
+    _NINTHER_THRESHOLD = 128
+
+    def __init__(self, introsort: bool = False, three_way: bool = False) -> None:
+        self._introsort = introsort
+        self._three_way = three_way
+        self._heapsort = Heapsort()
+
+    def _sort(self, array: list[int]) -> None:
+        if self._introsort:
+            self._intro_sort(array)
+        else:
+            self._quick_sort(array, 0, len(array) - 1)
 
     def _quick_sort(self, array: list[int], low: int, high: int) -> None:
         if low < high:
-            pivot_index = self._partition(array, low, high)
-            self._quick_sort(array, low, pivot_index - 1)
-            self._quick_sort(array, pivot_index + 1, high)
+            lt, gt = self._split(array, low, high)
+            self._quick_sort(array, low, lt - 1)
+            self._quick_sort(array, gt + 1, high)
+
+    def _intro_sort(self, array: list[int]) -> None:
+        """Sorts the array without recursion using an explicit stack of slices."""
+        stack = [(0, len(array) - 1, 2 * len(array).bit_length())]
+        while stack:
+            low, high, depth = stack.pop()
+            while high - low >= self._INSERTION_SORT_THRESHOLD:
+                # Too many bad pivots, finish the slice with heapsort
+                if depth == 0:
+                    self._heapsort.sort_range(array, low, high)
+                    break
+                depth -= 1
+
+                self._swap(array, self._select_pivot(array, low, high), high)
+                lt, gt = self._split(array, low, high)
+
+                # Defer the larger side so the stack holds at most O(log(n)) slices
+                if lt - low < high - gt:
+                    stack.append((gt + 1, high, depth))
+                    high = lt - 1
+                else:
+                    stack.append((low, lt - 1, depth))
+                    low = gt + 1
+            else:
+                self._insertion_sort(array, low, high)
+
+    def _split(self, array: list[int], low: int, high: int) -> tuple[int, int]:
+        """Partitions around array[high] and returns the bounds of the keys equal to the pivot."""
+        if self._three_way:
+            self._swap(array, low, high)
+            return self._partition_three_way(array, low, high)
+        pivot_index = self._partition(array, low, high)
+        return pivot_index, pivot_index
+
+    def _select_pivot(self, array: list[int], low: int, high: int) -> int:
+        """Returns the index of the median of three, or Tukey's ninther for large slices."""
+        mid = (low + high) // 2
+        if high - low < self._NINTHER_THRESHOLD:
+            return self._median_of_three(array, low, mid, high)
+
+        step = (high - low) // 8
+        return self._median_of_three(
+            array,
+            self._median_of_three(array, low, low + step, low + 2 * step),
+            self._median_of_three(array, mid - step, mid, mid + step),
+            self._median_of_three(array, high - 2 * step, high - step, high),
+        )
+
+    def _median_of_three(self, array: list[int], i: int, j: int, k: int) -> int:
+        if array[i] < array[j]:
+            if array[j] < array[k]: return j
+            return k if array[i] < array[k] else i
+        if array[i] < array[k]: return i
+        return k if array[j] < array[k] else j
+
+    def _insertion_sort(self, array: list[int], low: int, high: int) -> None:
+        """Sorts a small slice by shifting larger elements to the right."""
+        for i in range(low + 1, high + 1):
+            value = array[i]
+            j = i
+            while j > low and value < array[j - 1]:
+                array[j] = array[j - 1]
+                j -= 1
+            array[j] = value
 
-    def _partition(self, array: list[int], low: int, high: int) -> None:
+    def _partition(self, array: list[int], low: int, high: int) -> int:
         """Partitions the array and returns the pivot index."""
         pivot = array[high]
         i = low - 1
@@ -25,6 +109,46 @@ class QuickSort:
         self._swap(array, high, i + 1)
         return i + 1
 
+    def _partition_three_way(self, array: list[int], low: int, high: int) -> tuple[int, int]:
+        """Partitions the array around array[low] using Bentley-McIlroy and returns the
+        bounds of the keys equal to the pivot."""
+        pivot = array[low]
+        i, j = low, high + 1
+        p, q = low, high + 1
+        while True:
+            i += 1
+            while array[i] < pivot and i != high:
+                i += 1
+            j -= 1
+            while pivot < array[j] and j != low:
+                j -= 1
+
+            # Pointers cross
+            if i == j and array[i] == pivot:
+                p += 1
+                self._swap(array, p, i)
+            if i >= j: break
+
+            self._swap(array, i, j)
+
+            # Park keys equal to the pivot at both ends of the slice
+            if array[i] == pivot:
+                p += 1
+                self._swap(array, p, i)
+            if array[j] == pivot:
+                q -= 1
+                self._swap(array, q, j)
+
+        # Move the equal keys from both ends into the middle
+        i = j + 1
+        for k in range(low, p + 1):
+            self._swap(array, k, j)
+            j -= 1
+        for k in range(high, q - 1, -1):
+            self._swap(array, k, i)
+            i += 1
+        return j + 1, i - 1
+
     def _swap(self, array: list[int], i: int, j: int) -> None:
         array[i], array[j] = array[j], array[i]
 
@@ -35,6 +159,16 @@ def main() -> None:
     sorter.sort(array)
     print(array)
 
+    sorter = QuickSort(introsort=True)
+    array = list(range(100000, 0, -1))
+    sorter.sort(array)
+    print(array[:8])
+
+    sorter = QuickSort(introsort=True, three_way=True)
+    array = [i % 3 for i in range(100000)]
+    sorter.sort(array)
+    print(array[:8])
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,111 @@
+"""An implementation of radix sort - O(n * w)."""
+from typing import Callable, Optional
+from main.algorithms.sorting.counting_sort import CountingSort
+from main.algorithms.sorting.sorter import Sorter
+
+
+class RadixSort(Sorter):
+    """Class that sorts arrays using radix sort.
+
+    Integers are sorted least significant digit first and byte strings most significant
+    digit first. Every digit is distributed with a stable counting sort pass.
+
+    Attributes:
+        _bits: The width of an integer digit in bits.
+        _counting_sort: The counting sort used for every digit pass.
+    """
+    stable = True
+    comparison_based = False
+    _INSERTION_SORT_THRESHOLD = 16
+    _BYTE_VALUES = 256
+
+    def __init__(self, bits: int = 8) -> None:
+        if bits < 1: raise ValueError('Digit width should be at least one bit.')
+        self._bits = bits
+        self._counting_sort = CountingSort()
+
+    def _sort(self, array: list[int]) -> None:
+        """Sorts integers using a least significant digit radix sort."""
+        min_value = min(array)
+        max_value = max(array)
+        if min_value == max_value: return
+
+        # Offsetting by the minimum makes negative numbers sortable and skips unused high digits
+        values = self._lsd_radix_sort([value - min_value for value in array], max_value - min_value)
+        for i in range(len(values)):
+            array[i] = values[i] + min_value
+
+    def sort_bytes(self, array: list[bytes]) -> None:
+        """Sorts byte strings lexicographically using a most significant digit radix sort."""
+        if not array: return
+        self._msd_radix_sort(array)
+
+    def _argsort(self, keys: list[int], reverse: bool) -> list[int]:
+        """Orders the indices by their integer keys, which are offset from the maximum in reverse."""
+        min_value = min(keys)
+        max_value = max(keys)
+        offsets = [max_value - key for key in keys] if reverse else [key - min_value for key in keys]
+        return self._lsd_radix_sort(list(range(len(keys))), max_value - min_value, offsets.__getitem__)
+
+    def _lsd_radix_sort(self, array: list[int], span: int, key: Optional[Callable[[int], int]] = None) -> list[int]:
+        """Returns the array stably ordered by the keys in range(span + 1), one counting pass per digit."""
+        radix = 1 << self._bits
+        mask = radix - 1
+        for shift in range(0, span.bit_length(), self._bits):
+
+            def digit(value: int, shift: int = shift) -> int:
+                return ((value if key is None else key(value)) >> shift) & mask
+
+            array = self._counting_sort.sort_by_key(array, digit, radix)
+        return array
+
+    def _msd_radix_sort(self, array: list[bytes]) -> None:
+        # Key 0 is reserved for strings that end before the current digit
+        size = self._BYTE_VALUES + 1
+        stack = [(0, len(array), 0)]
+        while stack:
+            low, high, depth = stack.pop()
+            if high - low <= self._INSERTION_SORT_THRESHOLD:
+                self._insertion_sort(array, low, high, depth)
+                continue
+
+            def digit(value: bytes, depth: int = depth) -> int:
+                return value[depth] + 1 if depth < len(value) else 0
+
+            array[low:high] = self._counting_sort.sort_by_key(array[low:high], digit, size)
+
+            # Strings sharing the current digit are sorted by the next one
+            start = low
+            while start < high:
+                key = digit(array[start])
+                end = start + 1
+                while end < high and digit(array[end]) == key:
+                    end += 1
+                if key != 0 and end - start > 1:
+                    stack.append((start, end, depth + 1))
+                start = end
+
+    def _insertion_sort(self, array: list[bytes], low: int, high: int, depth: int) -> None:
+        """Sorts a small slice whose strings share their first depth bytes."""
+        for i in range(low + 1, high):
+            value = array[i]
+            j = i
+            while j > low and value[depth:] < array[j - 1][depth:]:
+                array[j] = array[j - 1]
+                j -= 1
+            array[j] = value
+
+
+def main() -> None:
+    sorter = RadixSort()
+    array = [10, 4, 6, 4, 8, -13, 2, 3, -(2**63), 2**63 - 1]
+    sorter.sort(array)
+    print(array)
+
+    array = [b'banana', b'apple', b'', b'app', b'cherry', b'apricot']
+    sorter.sort_bytes(array)
+    print(array)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,12 @@
 """An implementation of selection sort - O(n²)."""
+from main.algorithms.sorting.sorter import Sorter
 
 
-class SelectionSort:
+class SelectionSort(Sorter):
     """Class that sorts array using selection sort."""
+    stable = False
 
-    def sort(self, array: list[int]) -> None:
-        if not array: return
+    def _sort(self, array: list[int]) -> None:
         self._selection_sort(array)
 
     def _selection_sort(self, array: list[int]) -> None:
@@ -0,0 +1,53 @@
+"""The interface shared by the sorters, adding key functions, reverse order and argsort."""
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class Sorter(ABC):
+    """Base class of the sorting algorithms.
+
+    Subclasses implement _sort, which sorts a non-empty array in ascending order by comparing
+    the elements themselves. Sorting by key or in reverse computes every key once, sorts the
+    keys decorated with their position and moves the elements once at the end. The position
+    breaks ties, so keyed and reversed sorts are stable even when the algorithm is not.
+
+    Attributes:
+        stable: Whether the algorithm keeps equal elements in their original order.
+        comparison_based: Whether the algorithm only compares the elements, and does no arithmetic on them.
+    """
+    stable = False
+    comparison_based = True
+
+    def sort(self, array: list[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> None:
+        if len(array) == 0: return
+        if key is None and not reverse:
+            self._sort(array)
+            return
+
+        order = self.argsort(array, key, reverse)
+        values = [array[i] for i in order]
+        for i in range(len(values)):
+            array[i] = values[i]
+
+    def argsort(self, array: list[T], key: Optional[Callable[[T], Any]] = None, reverse: bool = False) -> list[int]:
+        """Returns the indices that would sort the array, without moving its elements."""
+        if len(array) == 0: return []
+        keys = [key(value) for value in array] if key is not None else list(array)
+        return self._argsort(keys, reverse)
+
+    @abstractmethod
+    def _sort(self, array: list[T]) -> None:
+        """Sorts the non-empty array in ascending order."""
+
+    def _argsort(self, keys: list[Any], reverse: bool) -> list[int]:
+        """Sorts the keys decorated with their index, negated in reverse so ties keep their order."""
+        if reverse:
+            decorated = [(keys[i], -i) for i in range(len(keys))]
+            self._sort(decorated)
+            return [-i for _, i in reversed(decorated)]
+
+        decorated = [(keys[i], i) for i in range(len(keys))]
+        self._sort(decorated)
+        return [i for _, i in decorated]
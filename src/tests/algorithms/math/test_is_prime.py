@@ -0,0 +1,47 @@
+"""Tests the primality checks."""
+import random
+import unittest
+from main.algorithms.math.is_prime import IsPrime
+from main.algorithms.math.sieve import Sieve
+
+
+class TestIsPrime(unittest.TestCase):
+    """Class that tests trial division and Miller-Rabin against the sieve."""
+
+    def test_small_numbers(self) -> None:
+        primes = set(Sieve().primes(20000))
+        for is_prime in (IsPrime(), IsPrime(miller_rabin=True)):
+            self.assertEqual(primes, {n for n in range(-5, 20000) if is_prime.is_prime(n)})
+
+    def test_squares_of_primes(self) -> None:
+        for is_prime in (IsPrime(), IsPrime(miller_rabin=True)):
+            for p in (5, 7, 11, 13, 1009):
+                self.assertFalse(is_prime.is_prime(p * p))
+
+    def test_miller_rabin_large_numbers(self) -> None:
+        is_prime = IsPrime(miller_rabin=True)
+        primes = [2**61 - 1, 2**89 - 1, 2**127 - 1, 10**18 + 9, 18446744073709551557]
+        composites = [
+            (2**31 - 1) * (2**61 - 1),
+            # Strong pseudoprimes to many small bases
+            3215031751,
+            3825123056546413051,
+            318665857834031151167461,
+            3317044064679887385961981,
+            (2**89 - 1) ** 2,
+        ]
+
+        for n in primes:
+            self.assertTrue(is_prime.is_prime(n))
+        for n in composites:
+            self.assertFalse(is_prime.is_prime(n))
+
+    def test_miller_rabin_matches_trial_division(self) -> None:
+        is_prime = IsPrime(miller_rabin=True)
+        for _ in range(2000):
+            n = random.randint(10**6, 10**9)
+            self.assertEqual(IsPrime().is_prime(n), is_prime.is_prime(n))
+
+    def test_invalid_rounds(self) -> None:
+        with self.assertRaises(ValueError):
+            IsPrime(miller_rabin=True, rounds=-1)
@@ -0,0 +1,45 @@
+"""Tests the segmented sieve of Eratosthenes."""
+import random
+import unittest
+from main.algorithms.math.sieve import Sieve
+
+
+class TestSieve(unittest.TestCase):
+    """Class that tests the segmented sieve against trial division."""
+
+    def test_primes(self) -> None:
+        expected = [n for n in range(2000) if self._is_prime(n)]
+        for segment_size in (1, 2, 7, 64, 1 << 18):
+            sieve = Sieve(segment_size)
+
+            self.assertEqual(expected, list(sieve.primes(2000)))
+            self.assertEqual([], list(sieve.primes(2)))
+            self.assertEqual([2], list(sieve.primes(3)))
+
+    def test_primes_in_range(self) -> None:
+        sieve = Sieve(segment_size=100)
+        for _ in range(100):
+            lo = random.randint(0, 10**6)
+            hi = lo + random.randint(0, 1000)
+            expected = [n for n in range(lo, hi) if self._is_prime(n)]
+
+            self.assertEqual(expected, list(sieve.primes_in_range(lo, hi)))
+            self.assertEqual(len(expected), sieve.count_primes(lo, hi))
+
+    def test_count_primes(self) -> None:
+        sieve = Sieve(segment_size=1 << 12)
+
+        self.assertEqual(78498, sieve.count_primes(0, 10**6))
+        self.assertEqual(4, sieve.count_primes(10**12, 10**12 + 100))
+
+    def test_is_lazy(self) -> None:
+        primes = Sieve().primes_in_range(10**13, 10**13 + 10**6)
+
+        self.assertEqual(10**13 + 37, next(primes))
+
+    def test_invalid_segment_size(self) -> None:
+        with self.assertRaises(ValueError):
+            Sieve(0)
+
+    def _is_prime(self, n: int) -> bool:
+        return n >= 2 and all(n % d for d in range(2, int(n**0.5) + 1))
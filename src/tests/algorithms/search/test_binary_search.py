@@ -0,0 +1,160 @@
+"""Tests the binary search implementations."""
+import bisect
+import math
+import random
+import unittest
+from array import array
+from main.algorithms.search.binary_search import BinarySearch, np
+
+
+class TestBinarySearch(unittest.TestCase):
+    """Class that tests binary search and its batched variants."""
+
+    def test_binary_search(self) -> None:
+        values = sorted(self._generate_random_list(200, -50, 50))
+        for target in range(-60, 60):
+            index = BinarySearch().binary_search(values, target)
+
+            if target in values:
+                self.assertEqual(target, values[index])
+            else:
+                self.assertEqual(-1, index)
+
+    def test_binary_search_empty_array(self) -> None:
+        self.assertEqual(-1, BinarySearch().binary_search([], 1))
+
+    def test_bounds(self) -> None:
+        binary_search = BinarySearch()
+        for size in (0, 1, 2, 10, 200):
+            values = sorted(self._generate_random_list(size, -10, 10))
+            for target in range(-12, 12):
+                lower = bisect.bisect_left(values, target)
+                upper = bisect.bisect_right(values, target)
+
+                self.assertEqual(lower, binary_search.lower_bound(values, target))
+                self.assertEqual(upper, binary_search.upper_bound(values, target))
+                self.assertEqual((lower, upper), binary_search.equal_range(values, target))
+                self.assertEqual(sum(1 for value in values if target <= value <= target + 3),
+                                 binary_search.count_between(values, target, target + 3))
+
+    def test_bounds_with_key_and_window(self) -> None:
+        binary_search = BinarySearch()
+        events = sorted(((random.randint(0, 50), str(i)) for i in range(300)), key=lambda event: event[0])
+        timestamps = [event[0] for event in events]
+
+        for target in range(-2, 53):
+            self.assertEqual(bisect.bisect_left(timestamps, target, 100, 200),
+                             binary_search.lower_bound(events, target, key=lambda event: event[0], lo=100, hi=200))
+            self.assertEqual(bisect.bisect_right(timestamps, target, 100, 200),
+                             binary_search.upper_bound(events, target, key=lambda event: event[0], lo=100, hi=200))
+        self.assertEqual(sum(1 for timestamp in timestamps[100:200] if 10 <= timestamp <= 20),
+                         binary_search.count_between(events, 10, 20, key=lambda event: event[0], lo=100, hi=200))
+        self.assertEqual(0, binary_search.count_between(events, 20, 10, key=lambda event: event[0]))
+
+        with self.assertRaises(ValueError):
+            binary_search.lower_bound(timestamps, 5, lo=10, hi=5)
+        with self.assertRaises(ValueError):
+            binary_search.upper_bound(timestamps, 5, hi=len(timestamps) + 1)
+
+    def test_search_many(self) -> None:
+        for size in (0, 1, 2, 10, 1000):
+            values = sorted(self._generate_random_list(size, -100, 100))
+            for targets in (self._generate_random_list(300, -120, 120), list(range(-120, 120, 3))):
+                expected = [values.index(target) if target in values else -1 for target in targets]
+
+                self.assertEqual(expected, BinarySearch().search_many(values, targets))
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_search_many_numpy(self) -> None:
+        values = sorted(self._generate_random_list(1000, -100, 100))
+        targets = self._generate_random_list(300, -120, 120)
+        expected = BinarySearch().search_many(values, targets)
+
+        for buffer in (array('q', values), np.array(values)):
+            indices = BinarySearch().search_many(buffer, targets)
+
+            self.assertIsInstance(indices, np.ndarray)
+            self.assertEqual(expected, indices.tolist())
+        self.assertEqual([-1, -1], BinarySearch().search_many(np.array([], dtype=np.int64), [1, 2]).tolist())
+
+    def test_binary_search_sqrt(self) -> None:
+        binary_search = BinarySearch()
+
+        self.assertAlmostEqual(math.sqrt(375), binary_search.binary_search_sqrt(0.0, 375.0, 375.0), places=6)
+        self.assertAlmostEqual(1.0, binary_search.binary_search_sqrt(1.0, 1.0 + 1e-9, 1.0), places=6)
+        self.assertEqual(0, binary_search.last_iterations)
+
+    def test_bisect_root(self) -> None:
+        binary_search = BinarySearch()
+        functions = [
+            (lambda x: x * x - 375, lambda x: 2 * x, 0.0, 375.0, math.sqrt(375)),
+            (lambda x: math.cos(x) - x, lambda x: -math.sin(x) - 1, 0.0, 1.0, 0.7390851332151607),
+            (lambda x: x ** 3, lambda x: 3 * x * x, -1.0, 2.0, 0.0),
+            (lambda x: math.exp(x) - 1e6, math.exp, 0.0, 100.0, math.log(1e6)),
+        ]
+        for f, derivative, low, high, root in functions:
+            iterations = {}
+            for method in ('bisection', 'secant', 'newton'):
+                result = binary_search.bisect_root(f, low, high, 1e-10, method=method, derivative=derivative)
+                self.assertAlmostEqual(root, result, places=8)
+                iterations[method] = binary_search.last_iterations
+
+            if root != 0.0:
+                self.assertLess(iterations['secant'], iterations['bisection'])
+                self.assertLess(iterations['newton'], iterations['bisection'])
+        self.assertEqual(2.0, binary_search.bisect_root(lambda x: x - 2, 2.0, 3.0))
+
+    def test_bisect_root_invalid_input(self) -> None:
+        binary_search = BinarySearch()
+
+        with self.assertRaises(ValueError):
+            binary_search.bisect_root(lambda x: x, 1.0, 0.0)
+        with self.assertRaises(ValueError):
+            binary_search.bisect_root(lambda x: x * x + 1, -1.0, 1.0)
+        with self.assertRaises(ValueError):
+            binary_search.bisect_root(lambda x: x, -1.0, 1.0, method='newton')
+        with self.assertRaises(ValueError):
+            binary_search.bisect_root(lambda x: x, -1.0, 1.0, method='regula falsi')
+
+    def test_bisect_roots(self) -> None:
+        binary_search = BinarySearch()
+        lows = [random.uniform(-10, 0) for _ in range(500)]
+        highs = [random.uniform(1, 10) for _ in range(500)]
+
+        roots = binary_search.bisect_roots(lambda x: x * x * x - 1, lows, highs, 1e-9)
+
+        self.assertEqual([1.0] * len(lows), [round(root, 7) for root in roots])
+        self.assertGreater(binary_search.last_iterations, 0)
+        roots = binary_search.bisect_roots(lambda x: x * x - 4, [2.0, 0.0, -3.0], [5.0, 2.0, -2.0])
+        self.assertEqual([2.0, 2.0, -2.0], list(roots))
+        with self.assertRaises(ValueError):
+            binary_search.bisect_roots(lambda x: x * x + 1, [-1.0], [1.0])
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_bisect_roots_numpy(self) -> None:
+        targets = np.random.uniform(0, 1000, 10000)
+
+        lows = np.zeros(targets.size)
+        highs = np.full(targets.size, 1000.0)
+
+        roots = BinarySearch().bisect_roots(lambda x: x * x - targets, lows, highs)
+
+        self.assertTrue(np.allclose(np.sqrt(targets), roots, atol=1e-7))
+
+    def test_integer_root(self) -> None:
+        binary_search = BinarySearch()
+        for k in range(1, 8):
+            for n in list(range(0, 300)) + [random.randint(0, 10**60) for _ in range(100)]:
+                root = binary_search.integer_root(n, k)
+
+                self.assertTrue(root ** k <= n < (root + 1) ** k)
+        self.assertEqual(10**100, binary_search.integer_root(10**300, 3))
+        self.assertLess(binary_search.last_iterations, 20)
+
+        with self.assertRaises(ValueError):
+            binary_search.integer_root(-1)
+        with self.assertRaises(ValueError):
+            binary_search.integer_root(8, 0)
+
+    def _generate_random_list(self, size: int, low: int, high: int) -> list[int]:
+        return [random.randint(low, high) for _ in range(0, size)]
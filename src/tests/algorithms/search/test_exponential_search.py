@@ -0,0 +1,22 @@
+"""Tests the exponential search implementation."""
+import bisect
+import random
+import unittest
+from main.algorithms.search.exponential_search import ExponentialSearch
+
+
+class TestExponentialSearch(unittest.TestCase):
+    """Class that tests exponential search against bisection."""
+
+    def test_exponential_search(self) -> None:
+        for size in list(range(0, 40)) + [1000]:
+            values = sorted(self._generate_random_list(size, -20, 20))
+            for target in range(-25, 25):
+                index = bisect.bisect_left(values, target)
+                expected = index if index < size and values[index] == target else -1
+
+                self.assertEqual(index, ExponentialSearch().lower_bound(values, target))
+                self.assertEqual(expected, ExponentialSearch().exponential_search(values, target))
+
+    def _generate_random_list(self, size: int, low: int, high: int) -> list[int]:
+        return [random.randint(low, high) for _ in range(0, size)]
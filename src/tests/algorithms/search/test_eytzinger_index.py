@@ -0,0 +1,42 @@
+"""Tests the Eytzinger layout search index."""
+import bisect
+import random
+import unittest
+from unittest import mock
+from main.algorithms.search import eytzinger_index
+from main.algorithms.search.binary_search import BinarySearch
+from main.algorithms.search.eytzinger_index import EytzingerIndex
+
+
+class TestEytzingerIndex(unittest.TestCase):
+    """Class that tests the Eytzinger index against binary search."""
+
+    def test_search(self) -> None:
+        for size in list(range(0, 40)) + [1000]:
+            values = sorted(self._generate_random_list(size, -20, 20))
+            targets = list(range(-25, 25))
+            expected = BinarySearch().search_many(values, targets)
+
+            for backend in (eytzinger_index.np, None):
+                with mock.patch.object(eytzinger_index, 'np', backend):
+                    index = EytzingerIndex(values)
+
+                    self.assertEqual(size, len(index))
+                    self.assertEqual([bisect.bisect_left(values, target) for target in targets],
+                                     [index.lower_bound(target) for target in targets])
+                    self.assertEqual(expected, [index.search(target) for target in targets])
+                    self.assertEqual(expected, list(index.search_many(targets)))
+
+    def test_layout_is_breadth_first(self) -> None:
+        index = EytzingerIndex(list(range(7)))
+
+        self.assertEqual([3, 1, 5, 0, 2, 4, 6], list(index._layout[1:]))  # pylint: disable=protected-access
+        self.assertEqual(2 * 8 * 8, index.nbytes)
+        self.assertTrue(index.build_seconds >= 0)
+
+    def test_unsorted_input(self) -> None:
+        with self.assertRaises(ValueError):
+            EytzingerIndex([2, 1])
+
+    def _generate_random_list(self, size: int, low: int, high: int) -> list[int]:
+        return [random.randint(low, high) for _ in range(0, size)]
@@ -0,0 +1,30 @@
+"""Tests the interpolation search implementation."""
+import bisect
+import random
+import unittest
+from main.algorithms.search.interpolation_search import InterpolationSearch
+
+
+class TestInterpolationSearch(unittest.TestCase):
+    """Class that tests interpolation search against bisection."""
+
+    def test_interpolation_search(self) -> None:
+        inputs = [sorted(self._generate_random_list(size, -20, 20)) for size in range(0, 40)]
+        inputs += [sorted(self._generate_random_list(1000, -20, 20)), [i * 0.5 for i in range(-40, 40)]]
+        for values in inputs:
+            for target in [-25, -20.5, 0.25] + list(range(-22, 22)):
+                index = bisect.bisect_left(values, target)
+                expected = index if index < len(values) and values[index] == target else -1
+
+                self.assertEqual(index, InterpolationSearch().lower_bound(values, target))
+                self.assertEqual(expected, InterpolationSearch().interpolation_search(values, target))
+
+    def test_skewed_keys(self) -> None:
+        values = sorted([2**i for i in range(60)] + [random.randint(0, 2**63) for _ in range(1000)])
+        for target in random.sample(values, 100) + [3, 2**64]:
+            index = bisect.bisect_left(values, target)
+
+            self.assertEqual(index, InterpolationSearch().lower_bound(values, target))
+
+    def _generate_random_list(self, size: int, low: int, high: int) -> list[int]:
+        return [random.randint(low, high) for _ in range(0, size)]
@@ -0,0 +1,50 @@
+"""Tests the learned piecewise linear index."""
+import bisect
+import random
+import unittest
+from main.algorithms.search.learned_index import LearnedIndex
+
+
+class TestLearnedIndex(unittest.TestCase):
+    """Class that tests the learned index against bisection."""
+
+    def test_lower_bound(self) -> None:
+        inputs = [sorted(self._generate_random_list(size, -50, 50)) for size in range(0, 40)]
+        inputs += [
+            sorted(self._generate_random_list(5000, -2**63, 2**63 - 1)),
+            sorted(int(random.lognormvariate(0, 5)) for _ in range(5000)),
+            sorted(random.random() for _ in range(5000)),
+            [i * i for i in range(5000)],
+            [7] * 1000,
+        ]
+        for values in inputs:
+            targets = random.sample(values, min(len(values), 200)) + self._generate_random_list(100, -60, 60)
+            targets += [value + 1 for value in values[:100]] + [values[-1] + 1 if values else 0]
+            for epsilon in (1, 4, 64):
+                index = LearnedIndex(values, epsilon)
+                for target in targets:
+                    expected = bisect.bisect_left(values, target)
+
+                    self.assertEqual(expected, index.lower_bound(target))
+                    self.assertEqual(expected if target in values else -1, index.search(target))
+
+    def test_segments_bound_the_error(self) -> None:
+        # pylint: disable=protected-access
+        values = sorted(set(int(random.lognormvariate(0, 3) * 1000) for _ in range(5000)))
+        index = LearnedIndex(values, epsilon=8)
+
+        for i, value in enumerate(values):
+            segment = bisect.bisect_right(index._keys, value) - 1
+            prediction = index._positions[segment] + int(index._slopes[segment] * (value - index._keys[segment]))
+            self.assertTrue(abs(prediction - i) <= 9)
+        self.assertLess(index.segments, len(values) // 4)
+        self.assertEqual(1, LearnedIndex(list(range(10000))).segments)
+
+    def test_invalid_input(self) -> None:
+        with self.assertRaises(ValueError):
+            LearnedIndex([1, 2], epsilon=0)
+        with self.assertRaises(ValueError):
+            LearnedIndex([2, 1])
+
+    def _generate_random_list(self, size: int, low: int, high: int) -> list[int]:
+        return [random.randint(low, high) for _ in range(0, size)]
@@ -0,0 +1,54 @@
+"""Tests the memory-mapped sorted key index."""
+import bisect
+import os
+import random
+import tempfile
+import unittest
+from array import array
+from main.algorithms.search.mapped_sorted_index import MappedSortedIndex
+
+
+class TestMappedSortedIndex(unittest.TestCase):
+    """Class that tests the mapped index against bisection of the loaded keys."""
+
+    def test_bounds(self) -> None:
+        for size in (0, 1, 2, 7, 1000, 3000):
+            values = sorted(self._generate_random_list(size, -50, 50))
+            with tempfile.TemporaryDirectory() as directory:
+                path = self._write_keys(directory, values)
+
+                for fence_stride in (None, 512, 700, 5000):
+                    with MappedSortedIndex(path, fence_stride) as index:
+                        self.assertEqual(size, len(index))
+                        for target in range(-55, 55):
+                            lower = bisect.bisect_left(values, target)
+                            upper = bisect.bisect_right(values, target)
+
+                            self.assertEqual(lower, index.lower_bound(target))
+                            self.assertEqual(upper, index.upper_bound(target))
+                            self.assertEqual((lower, upper), index.equal_range(target))
+                            self.assertEqual(lower if lower < upper else -1, index.search(target))
+                            self.assertEqual(bisect.bisect_right(values, target + 5) - lower,
+                                             index.count_between(target, target + 5))
+
+    def test_invalid_input(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'keys')
+            with open(path, 'wb') as file:
+                file.write(b'\x00' * 12)
+
+            with self.assertRaises(ValueError):
+                MappedSortedIndex(path)
+            with self.assertRaises(ValueError):
+                MappedSortedIndex(self._write_keys(directory, [1, 2]), fence_stride=0)
+            with self.assertRaises(ValueError):
+                MappedSortedIndex(self._write_keys(directory, [1, 2]), fence_stride=64)
+
+    def _write_keys(self, directory: str, values: list[int]) -> str:
+        path = os.path.join(directory, f'keys-{len(values)}')
+        with open(path, 'wb') as file:
+            array('q', values).tofile(file)
+        return path
+
+    def _generate_random_list(self, size: int, low: int, high: int) -> list[int]:
+        return [random.randint(low, high) for _ in range(0, size)]
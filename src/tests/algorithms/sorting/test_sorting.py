@@ -1,7 +1,12 @@
 """Tests the sorting implementations."""
 import copy
+import functools
+import itertools
+import os
 import random
+import tempfile
 import unittest
+from array import array
 from enum import Enum, auto
 from main.algorithms.sorting.bubble_sort import BubbleSort
 from main.algorithms.sorting.heapsort import Heapsort
@@ -11,17 +16,52 @@ from main.algorithms.sorting.selection_sort import SelectionSort
 from main.algorithms.sorting.merge_sort import MergeSort
 from main.algorithms.sorting.bucket_sort import BucketSort
 from main.algorithms.sorting.counting_sort import CountingSort
+from main.algorithms.sorting.radix_sort import RadixSort
+from main.algorithms.sorting.numpy_backend import np
+from main.algorithms.sorting.parallel_merge_sort import ParallelMergeSort
+from main.algorithms.sorting.parallel_sample_sort import ParallelSampleSort
+from main.algorithms.sorting.external_merge_sort import ExternalMergeSort
+from main.algorithms.sorting.k_way_merge import KWayMerge
+from main.algorithms.sorting.adaptive_sort import AdaptiveSort
+from main.algorithms.sorting.quick_select import QuickSelect
+from main.algorithms.sorting.instrumentation import SortProfiler
 
 
 class SortingAlgorithm(Enum):
+    """The sorters under test."""
     BUBBLE_SORT = auto()
     HEAP_SORT = auto()
+    BOTTOM_UP_HEAP_SORT = auto()
+    D_ARY_HEAP_SORT = auto()
+    BOTTOM_UP_D_ARY_HEAP_SORT = auto()
     QUICK_SORT = auto()
+    INTRO_SORT = auto()
+    THREE_WAY_QUICK_SORT = auto()
+    THREE_WAY_INTRO_SORT = auto()
     INSERTION_SORT = auto()
     SELECTION_SORT = auto()
     MERGE_SORT = auto()
+    NATURAL_MERGE_SORT = auto()
     BUCKET_SORT = auto()
     COUNT_SORT = auto()
+    RADIX_SORT = auto()
+    PARALLEL_MERGE_SORT = auto()
+    PARALLEL_SAMPLE_SORT = auto()
+    ADAPTIVE_SORT = auto()
+
+
+class _Record:
+    """Record that is compared by its key only."""
+
+    def __init__(self, key: int, index: int) -> None:
+        self.key = key
+        self.index = index
+
+    def __lt__(self, other: '_Record') -> bool:
+        return self.key < other.key
+
+    def __le__(self, other: '_Record') -> bool:
+        return self.key <= other.key
 
 
 class TestSorting(unittest.TestCase):
@@ -32,12 +72,27 @@ class TestSorting(unittest.TestCase):
         self._algorithms = {
             SortingAlgorithm.BUBBLE_SORT: BubbleSort,
             SortingAlgorithm.HEAP_SORT: Heapsort,
+            SortingAlgorithm.BOTTOM_UP_HEAP_SORT: functools.partial(Heapsort, bottom_up=True),
+            SortingAlgorithm.D_ARY_HEAP_SORT: functools.partial(Heapsort, arity=4),
+            SortingAlgorithm.BOTTOM_UP_D_ARY_HEAP_SORT: functools.partial(Heapsort, bottom_up=True, arity=8),
             SortingAlgorithm.QUICK_SORT: QuickSort,
+            SortingAlgorithm.INTRO_SORT: functools.partial(QuickSort, introsort=True),
+            SortingAlgorithm.THREE_WAY_QUICK_SORT: functools.partial(QuickSort, three_way=True),
+            SortingAlgorithm.THREE_WAY_INTRO_SORT: functools.partial(QuickSort, introsort=True, three_way=True),
             SortingAlgorithm.INSERTION_SORT: InsertionSort,
             SortingAlgorithm.SELECTION_SORT: SelectionSort,
             SortingAlgorithm.MERGE_SORT: MergeSort,
+            SortingAlgorithm.NATURAL_MERGE_SORT: functools.partial(MergeSort, natural=True),
             SortingAlgorithm.BUCKET_SORT: BucketSort,
             SortingAlgorithm.COUNT_SORT: CountingSort,
+            SortingAlgorithm.RADIX_SORT: RadixSort,
+            SortingAlgorithm.PARALLEL_MERGE_SORT: functools.partial(ParallelMergeSort, 1),
+            SortingAlgorithm.PARALLEL_SAMPLE_SORT: functools.partial(ParallelSampleSort, 1),
+            SortingAlgorithm.ADAPTIVE_SORT: AdaptiveSort,
+        }
+        self._integer_algorithms = {
+            SortingAlgorithm.COUNT_SORT,
+            SortingAlgorithm.RADIX_SORT,
         }
 
     def test_small_positive_integers(self) -> None:
@@ -64,5 +119,475 @@ class TestSorting(unittest.TestCase):
 
                 self.assertEqual(values, cpy)
 
+    def test_key_and_reverse(self) -> None:
+        for size in range(0, self._loops, 7):
+            for algorithm in self._algorithms:
+                sorter = self._algorithms.get(algorithm)()
+                values = [(key, str(i)) for i, key in enumerate(self._generate_random_list(size, -5, 5))]
+
+                for reverse in (False, True):
+                    cpy = copy.deepcopy(values)
+                    expected = sorted(values, key=lambda value: value[0], reverse=reverse)
+
+                    sorter.sort(cpy, key=lambda value: value[0], reverse=reverse)
+
+                    self.assertEqual(expected, cpy)
+
+    def test_reverse_without_key(self) -> None:
+        for algorithm in self._algorithms:
+            sorter = self._algorithms.get(algorithm)()
+            values = self._generate_random_list(50, -50, 51)
+            cpy = copy.deepcopy(values)
+
+            values.sort(reverse=True)
+            sorter.sort(cpy, reverse=True)
+
+            self.assertEqual(values, cpy)
+
+    def test_argsort(self) -> None:
+        for algorithm in self._algorithms:
+            sorter = self._algorithms.get(algorithm)()
+            values = self._generate_random_list(50, -50, 51)
+            keys = [-value for value in values]
+
+            order = sorter.argsort(values, key=lambda value: -value)
+
+            self.assertEqual(sorted(range(len(keys)), key=keys.__getitem__), order)
+            self.assertEqual(values, [-key for key in keys])
+            self.assertEqual(sorter.argsort([]), [])
+
+    def test_stable_property(self) -> None:
+        for algorithm in self._algorithms:
+            sorter = self._algorithms.get(algorithm)()
+            if not sorter.stable or algorithm in self._integer_algorithms: continue
+
+            keys = self._generate_random_list(200, 0, 5)
+            values = [_Record(key, i) for i, key in enumerate(keys)]
+            expected = sorted(values, key=lambda record: record.key)
+
+            sorter.sort(values)
+
+            self.assertEqual([record.index for record in expected], [record.index for record in values])
+
+    def test_adaptive_sort_decisions(self) -> None:
+        size = 5000
+        inputs = {
+            'InsertionSort': [random.random() for _ in range(10)],
+            'CountingSort': self._generate_random_list(size, 0, size),
+            'MergeSort': [i / 10 for i in range(size, 0, -1)] + [random.random() for _ in range(10)],
+            'RadixSort': self._generate_random_list(size * 20, 0, 2**40),
+            'QuickSort': [random.random() for _ in range(size)],
+        }
+        for algorithm, values in inputs.items():
+            sorter = AdaptiveSort()
+            cpy = copy.deepcopy(values)
+
+            values.sort()
+            sorter.sort(cpy)
+
+            self.assertEqual(values, cpy)
+            self.assertEqual(sorter.last_decision.algorithm, algorithm)
+
+    def test_adaptive_sort_profile(self) -> None:
+        sorter = AdaptiveSort()
+
+        profile = sorter.profile([random.choice('ab') for _ in range(5000)])
+        self.assertFalse(profile.integers)
+        self.assertGreater(profile.duplicate_ratio, 0.9)
+        self.assertEqual(sorter.decide([random.choice('ab') for _ in range(5000)]).reason, 'many duplicate keys')
+
+        profile = sorter.profile(list(range(5000, 0, -1)))
+        self.assertEqual(profile.key_range, 5000)
+        self.assertEqual(profile.descent_ratio, 1.0)
+        self.assertEqual(profile.inversion_ratio, 1.0)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_adaptive_sort_integer_buffers(self) -> None:
+        cases = (
+            (5000, 0, 100, 'CountingSort'),
+            (5000, -2**63, 2**63 - 1, 'BucketSort'),
+            (100, -2**63, 2**63 - 1, 'BucketSort'),
+        )
+        for size, low, high, algorithm in cases:
+            values = self._generate_random_list(size, low, high)
+            sorter = AdaptiveSort()
+            cpy = array('q', values)
+
+            values.sort()
+            sorter.sort(cpy)
+
+            self.assertEqual(values, cpy.tolist())
+            self.assertEqual(sorter.last_decision.algorithm, algorithm)
+
+    def test_introsort_adversarial_inputs(self) -> None:
+        size = 20000
+        inputs = [
+            list(range(size)),
+            list(range(size, 0, -1)),
+            [7] * size,
+            [i % 2 for i in range(size)],
+            list(range(size // 2)) + list(range(size // 2, 0, -1)),
+        ]
+        for values in inputs:
+            for three_way in (False, True):
+                sorter = QuickSort(introsort=True, three_way=three_way)
+                cpy = copy.deepcopy(values)
+                expected = sorted(values)
+
+                sorter.sort(cpy)
+
+                self.assertEqual(expected, cpy)
+
+    def test_three_way_partition(self) -> None:
+        for size in range(2, self._loops):
+            values = self._generate_random_list(size, 0, 4)
+            sorter = QuickSort(three_way=True)
+            pivot = values[0]
+
+            lt, gt = sorter._partition_three_way(values, 0, size - 1)  # pylint: disable=protected-access
+
+            self.assertTrue(all(value < pivot for value in values[:lt]))
+            self.assertTrue(all(value == pivot for value in values[lt:gt + 1]))
+            self.assertTrue(all(value > pivot for value in values[gt + 1:]))
+
+    def test_natural_merge_sort_runs(self) -> None:
+        size = 5000
+        inputs = [
+            list(range(size)),
+            list(range(size, 0, -1)),
+            list(range(size)) + self._generate_random_list(50, 0, size),
+            [i // 100 for i in range(size)] + [i // 100 for i in range(size, 0, -1)],
+            [i % 500 for i in range(size)],
+            self._generate_random_list(size, -100, 100),
+        ]
+        for values in inputs:
+            sorter = MergeSort(natural=True)
+            cpy = copy.deepcopy(values)
+
+            values.sort()
+            sorter.sort(cpy)
+
+            self.assertEqual(values, cpy)
+
+    def test_natural_merge_sort_stability(self) -> None:
+        size = 2000
+        keys = self._generate_random_list(size, 0, 10)
+        values = [_Record(key, i) for i, key in enumerate(keys)]
+        values[size // 2:] = sorted(values[size // 2:], key=lambda record: -record.key)
+
+        cpy = copy.deepcopy(values)
+        values.sort(key=lambda record: record.key)
+        MergeSort(natural=True).sort(cpy)
+
+        self.assertEqual([record.index for record in values], [record.index for record in cpy])
+
+    def test_radix_sort_wide_integers(self) -> None:
+        for bits in (1, 3, 8, 11, 16):
+            values = self._generate_random_list(500, -2**63, 2**63 - 1)
+            sorter = RadixSort(bits)
+            cpy = copy.deepcopy(values)
+
+            values.sort()
+            sorter.sort(cpy)
+
+            self.assertEqual(values, cpy)
+
+    def test_radix_sort_invalid_digit_width(self) -> None:
+        with self.assertRaises(ValueError):
+            RadixSort(0)
+
+    def test_radix_sort_bytes(self) -> None:
+        for size in range(0, self._loops):
+            values = [bytes(random.randint(0, 3) for _ in range(random.randint(0, 6))) for _ in range(size * 5)]
+            sorter = RadixSort()
+            cpy = copy.deepcopy(values)
+
+            values.sort()
+            sorter.sort_bytes(cpy)
+
+            self.assertEqual(values, cpy)
+
+    def test_counting_sort_by_key_is_stable(self) -> None:
+        values = [(random.randint(0, 9), i) for i in range(500)]
+
+        ordered = CountingSort().sort_by_key(values, lambda value: value[0], 10)
+
+        self.assertEqual(sorted(values), ordered)
+
+    def test_bucket_sort_skewed_floats(self) -> None:
+        inputs = [
+            [random.lognormvariate(0, 2) for _ in range(5000)],
+            [random.random() for _ in range(5000)],
+            [random.choice((0.5, 1.5, 2.5)) for _ in range(5000)] + [random.random() for _ in range(50)],
+            [float(i) for i in range(5000, 0, -1)],
+        ]
+        for values in inputs:
+            sorter = BucketSort()
+            cpy = copy.deepcopy(values)
+
+            values.sort()
+            sorter.sort(cpy)
+
+            self.assertEqual(values, cpy)
+
+    def test_integer_buffers(self) -> None:
+        for sorter in (CountingSort(), BucketSort()):
+            for size in range(0, self._loops):
+                values = self._generate_random_list(size, -50, 51)
+                cpy = array('q', values)
+
+                values.sort()
+                sorter.sort(cpy)
+
+                self.assertEqual(values, cpy.tolist())
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_numpy_backend(self) -> None:
+        small_ranges = [
+            np.array(self._generate_random_list(5000, -128, 127), dtype=np.int8),
+            np.array(self._generate_random_list(5000, 0, 3), dtype=np.int32),
+            np.array([], dtype=np.int64),
+        ]
+        wide_ranges = [
+            np.array(self._generate_random_list(5000, -2**63, 2**63 - 1), dtype=np.int64),
+            np.array(self._generate_random_list(5000, 0, 2**64 - 1), dtype=np.uint64),
+            np.array([2**63 - 1, -2**63, 5], dtype=np.int64),
+            np.array([2**64 - 1, 0, 5], dtype=np.uint64),
+        ]
+        for sorter, inputs in ((CountingSort(), small_ranges), (BucketSort(), small_ranges + wide_ranges)):
+            for values in inputs:
+                cpy = values.copy()
+
+                sorter.sort(cpy)
+
+                self.assertTrue(np.array_equal(np.sort(values), cpy))
+
+        for typecode, values in (('q', [2**63 - 1, -2**63, 5]), ('Q', [2**64 - 1, 0, 5])):
+            cpy = array(typecode, values)
+
+            BucketSort().sort(cpy)
+
+            self.assertEqual(sorted(values), cpy.tolist())
+
+    def test_parallel_merge_sort(self) -> None:
+        for workers in (1, 2, 3):
+            for size in (0, 1, 2, 5, 1000):
+                sorter = ParallelMergeSort(workers)
+                values = self._generate_random_list(size, -2**63, 2**63 - 1)
+                cpy = copy.deepcopy(values)
+
+                values.sort()
+                sorter.sort(cpy)
+
+                self.assertEqual(values, cpy)
+
+    def test_parallel_merge_sort_invalid_workers(self) -> None:
+        with self.assertRaises(ValueError):
+            ParallelMergeSort(0)
+
+    def test_parallel_sample_sort(self) -> None:
+        for workers in (2, 3):
+            for low, high in ((-2**63, 2**63 - 1), (0, 3), (5, 5)):
+                for size in (0, 1, 2, 5, 1000):
+                    sorter = ParallelSampleSort(workers)
+                    values = self._generate_random_list(size, low, high)
+                    cpy = copy.deepcopy(values)
+
+                    values.sort()
+                    sorter.sort(cpy)
+
+                    self.assertEqual(values, cpy)
+                    if size > 0: self.assertEqual(size, sum(sorter.last_bucket_sizes))
+
+    def test_parallel_sample_sort_invalid_arguments(self) -> None:
+        with self.assertRaises(ValueError):
+            ParallelSampleSort(0)
+        with self.assertRaises(ValueError):
+            ParallelSampleSort(2, oversampling=0)
+
+    def test_k_way_merge(self) -> None:
+        merger = KWayMerge()
+        for k in range(0, 10):
+            iterables = [sorted(self._generate_random_list(random.randint(0, 20), -5, 5)) for _ in range(k)]
+            expected = sorted(value for iterable in iterables for value in iterable)
+
+            self.assertEqual(expected, list(merger.merge(iterables)))
+            reversed_iterables = [iterable[::-1] for iterable in iterables]
+            self.assertEqual(expected[::-1], list(merger.merge(reversed_iterables, reverse=True)))
+
+    def test_k_way_merge_is_stable(self) -> None:
+        iterables = [
+            [_Record(key, i) for key in sorted(self._generate_random_list(50, 0, 5))]
+            for i in range(7)
+        ]
+
+        merged = list(KWayMerge().merge(iter(iterable) for iterable in iterables))
+
+        records = [(record.key, record.index) for record in merged]
+        self.assertEqual(sorted(records), records)
+
+    def test_k_way_merge_with_key_is_lazy(self) -> None:
+        iterables = [itertools.count(i, 3) for i in range(3)]
+
+        merged = KWayMerge().merge(iterables, key=lambda value: -value, reverse=True)
+
+        self.assertEqual(list(range(10)), list(itertools.islice(merged, 10)))
+
+    def test_external_merge_sort(self) -> None:
+        for size, fan_in in ((0, 2), (1, 2), (7, 2), (5000, 2), (5000, 4), (5000, 64)):
+            values = self._generate_random_list(size, -2**63, 2**63 - 1)
+            sorter = ExternalMergeSort(memory_budget=64 * 100, fan_in=fan_in)
+
+            with tempfile.TemporaryDirectory() as directory:
+                input_path = os.path.join(directory, 'input')
+                output_path = os.path.join(directory, 'output')
+                with open(input_path, 'wb') as file:
+                    array('q', values).tofile(file)
+
+                sorter.sort_file(input_path, output_path)
+
+                with open(output_path, 'rb') as file:
+                    cpy = array('q', file.read()).tolist()
+
+            values.sort()
+            self.assertEqual(values, cpy)
+
+    def test_external_merge_sort_invalid_input(self) -> None:
+        with self.assertRaises(ValueError):
+            ExternalMergeSort(fan_in=1)
+        with self.assertRaises(ValueError):
+            ExternalMergeSort(memory_budget=64, fan_in=2)
+
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, 'input')
+            with open(input_path, 'wb') as file:
+                file.write(b'\x00' * 12)
+
+            with self.assertRaises(ValueError):
+                ExternalMergeSort().sort_file(input_path, os.path.join(directory, 'output'))
+
+    def test_heapsort_range(self) -> None:
+        values = self._generate_random_list(50, -50, 51)
+        values[10:40] = sorted(values[10:40])
+        for bottom_up in (False, True):
+            for arity in (2, 4, 8):
+                cpy = values[:10] + values[10:40][::-1] + values[40:]
+
+                Heapsort(bottom_up, arity).sort_range(cpy, 10, 39)
+
+                self.assertEqual(values, cpy)
+
+    def test_bottom_up_heapsort_comparisons(self) -> None:
+        values = self._generate_random_list(2000, 0, 10**6)
+        comparisons = {}
+        for bottom_up in (False, True):
+            sorter = Heapsort(bottom_up=bottom_up)
+            with SortProfiler(sorter, trace_calls=False, trace_memory=False) as profiler:
+                sorter.sort(copy.deepcopy(values))
+            comparisons[bottom_up] = profiler.last.comparisons
+
+        self.assertTrue(comparisons[True] < 0.75 * comparisons[False])
+
+    def test_heapsort_invalid_arity(self) -> None:
+        with self.assertRaises(ValueError):
+            Heapsort(arity=1)
+
+    def test_nth_element(self) -> None:
+        inputs = [self._generate_random_list(size, -20, 20) for size in range(1, self._loops)]
+        inputs += [list(range(5000)), list(range(5000, 0, -1)), [3] * 5000, [i % 5 for i in range(5000)]]
+        for values in inputs:
+            expected = sorted(values)
+            for n in (0, len(values) // 3, len(values) - 1):
+                cpy = copy.deepcopy(values)
+
+                self.assertEqual(expected[n], QuickSelect().nth_element(cpy, n))
+                self.assertTrue(all(value <= cpy[n] for value in cpy[:n]))
+                self.assertTrue(all(value >= cpy[n] for value in cpy[n + 1:]))
+                self.assertEqual(expected, sorted(cpy))
+
+        with self.assertRaises(IndexError):
+            QuickSelect().nth_element([1, 2], 2)
+
+    def test_median_of_medians(self) -> None:
+        values = self._generate_random_list(3000, 0, 1000)
+        cpy = copy.deepcopy(values)
+
+        pivot = cpy[QuickSelect()._median_of_medians(cpy, 0, len(cpy) - 1)]  # pylint: disable=protected-access
+
+        # The pivot is guaranteed to lie between the 30th and 70th percentile
+        self.assertEqual(sorted(values), sorted(cpy))
+        self.assertTrue(sum(1 for value in cpy if value <= pivot) >= 3 * len(cpy) // 10 - 5)
+        self.assertTrue(sum(1 for value in cpy if value >= pivot) >= 3 * len(cpy) // 10 - 5)
+
+    def test_partial_sort(self) -> None:
+        values = self._generate_random_list(1000, -500, 500)
+        for k in (0, 1, 10, 500, 1000):
+            cpy = copy.deepcopy(values)
+
+            QuickSelect().partial_sort(cpy, k)
+
+            self.assertEqual(sorted(values)[:k], cpy[:k])
+            self.assertEqual(sorted(values), sorted(cpy))
+
+        with self.assertRaises(ValueError):
+            QuickSelect().partial_sort([1, 2], 3)
+
+    def test_top_k(self) -> None:
+        values = self._generate_random_list(1000, -500, 500)
+        for k in (0, 1, 10, 1000, 2000):
+            self.assertEqual(sorted(values, reverse=True)[:k], QuickSelect().top_k(iter(values), k))
+
+        words = ['bb', 'a', 'cc', 'ddd', 'e']
+        self.assertEqual(['ddd', 'bb', 'cc'], QuickSelect().top_k(words, 3, key=len))
+
+        with self.assertRaises(ValueError):
+            QuickSelect().top_k(values, -1)
+
+    def test_sort_profiler(self) -> None:
+        sorter = BubbleSort()
+        records = []
+        with SortProfiler(sorter, callback=records.append) as profiler:
+            values = list(range(10, 0, -1))
+            sorter.sort(values)
+            words = ['ccc', 'a', 'bb']
+            sorter.sort(words, key=len)
+
+        self.assertEqual(list(range(1, 11)), values)
+        self.assertEqual(['a', 'bb', 'ccc'], words)
+        self.assertEqual(records, profiler.records)
+        self.assertEqual(2, len(records))
+
+        # Every inversion of the reversed input takes one swap of two writes
+        stats = records[0]
+        self.assertEqual(45, stats.swaps)
+        self.assertEqual(90, stats.moves)
+        self.assertTrue(stats.comparisons >= 45)
+        self.assertTrue(stats.peak_bytes >= 0)
+        self.assertIn('BubbleSort._bubble_sort', stats.phases)
+        self.assertTrue(records[1].comparisons > 0)
+
+        # Leaving the block restores the unprofiled sort
+        self.assertNotIn('sort', vars(sorter))
+
+    def test_sort_profiler_recursion_depth(self) -> None:
+        values = list(range(100))
+        for sorter, depth in ((QuickSort(), 100), (QuickSort(introsort=True), 1), (MergeSort(), 8)):
+            with SortProfiler(sorter, trace_memory=False) as profiler:
+                sorter.sort(copy.deepcopy(values))
+
+            self.assertEqual(depth, profiler.last.max_depth)
+
+    def test_sort_profiler_integer_sorter(self) -> None:
+        values = self._generate_random_list(100, -10, 10)
+        for sorter in (AdaptiveSort(), RadixSort(), CountingSort()):
+            with SortProfiler(sorter) as profiler:
+                cpy = copy.deepcopy(values)
+                sorter.sort(cpy)
+
+            self.assertEqual(sorted(values), cpy)
+            self.assertIsNone(profiler.last.comparisons)
+            self.assertIsNone(profiler.last.moves)
+        self.assertIn('CountingSort._counting_sort', profiler.last.phases)
+
     def _generate_random_list(self, size: int, low: int, high: int) -> list[int]:
         return [random.randint(low, high) for _ in range(0, size)]
@@ -0,0 +1,46 @@
+"""Tests the sorting benchmark suite."""
+import unittest
+from benchmarks.sorting import DISTRIBUTIONS, SORTERS, compare, run
+
+
+class TestSortingBenchmark(unittest.TestCase):
+    """Class that tests the sorting benchmark and its regression tracking."""
+
+    def setUp(self) -> None:
+        self._tolerances = {
+            'seconds': 0.5,
+            'comparisons': 0.0,
+            'swaps': 0.0,
+            'moves': 0.0,
+            'max_depth': 0.0,
+            'peak_bytes': 0.1,
+        }
+
+    def test_run_covers_every_combination(self) -> None:
+        results = run([50], list(SORTERS), list(DISTRIBUTIONS), 1, 0)
+
+        self.assertEqual(len(results), len(SORTERS) * len(DISTRIBUTIONS))
+        for result in results:
+            self.assertIsNotNone(result['seconds'])
+            self.assertIsNotNone(result['peak_bytes'])
+        self.assertEqual(compare(results, results, self._tolerances), [])
+
+    def test_compare_reports_regressions(self) -> None:
+        baseline = [{
+            'algorithm': 'heapsort',
+            'distribution': 'random',
+            'size': 1000,
+            'seconds': 0.1,
+            'comparisons': 100,
+            'swaps': 50,
+            'peak_bytes': 10000,
+        }]
+        noise = [dict(baseline[0], seconds=0.12, peak_bytes=10500)]
+        slower = [dict(baseline[0], seconds=0.2, comparisons=101)]
+        failing = [
+            dict(baseline[0], seconds=None, comparisons=None, swaps=None, peak_bytes=None, error='RecursionError')
+        ]
+
+        self.assertEqual(compare(noise, baseline, self._tolerances), [])
+        self.assertEqual(len(compare(slower, baseline, self._tolerances)), 2)
+        self.assertEqual(len(compare(failing, baseline, self._tolerances)), 1)